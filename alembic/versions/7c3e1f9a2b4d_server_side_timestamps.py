@@ -0,0 +1,91 @@
+"""Server-side created_at/updated_at defaults
+
+Revision ID: 7c3e1f9a2b4d
+Revises: 49d0a2c5c7e6
+Create Date: 2026-10-15 22:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3e1f9a2b4d'
+down_revision = '49d0a2c5c7e6'
+branch_labels = None
+depends_on = None
+
+
+TIMESTAMPED_TABLES = (
+    'users',
+    'institutions',
+    'categories',
+    'payees',
+    'accounts',
+    'transactions',
+    'user_sessions',
+    'user_oauth_accounts',
+    'impersonation_sessions',
+)
+
+
+def _existing_tables() -> list:
+    # impersonation_sessions may have been created outside Alembic
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    return [table for table in TIMESTAMPED_TABLES if table in existing]
+
+
+def _utc_now_sql() -> str:
+    # CURRENT_TIMESTAMP is server local time on Postgres and MySQL, UTC on SQLite
+    return {
+        'postgresql': "timezone('utc', now())",
+        'mysql': 'UTC_TIMESTAMP()',
+    }.get(op.get_bind().dialect.name, 'CURRENT_TIMESTAMP')
+
+
+def upgrade() -> None:
+    utc_now = _utc_now_sql()
+    for table in _existing_tables():
+        # Backfill before tightening to NOT NULL
+        op.execute(f"UPDATE {table} SET created_at = {utc_now} WHERE created_at IS NULL")
+        op.execute(f"UPDATE {table} SET updated_at = created_at WHERE updated_at IS NULL")
+
+        # Stored values are naive UTC; convert them as UTC, not as server local time
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'created_at',
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                postgresql_using="created_at AT TIME ZONE 'UTC'",
+                server_default=sa.func.now(),
+                nullable=False,
+            )
+            batch_op.alter_column(
+                'updated_at',
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                postgresql_using="updated_at AT TIME ZONE 'UTC'",
+                server_default=sa.func.now(),
+                nullable=False,
+            )
+
+
+def downgrade() -> None:
+    for table in _existing_tables():
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'created_at',
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.DateTime(),
+                postgresql_using="created_at AT TIME ZONE 'UTC'",
+                server_default=None,
+                nullable=True,
+            )
+            batch_op.alter_column(
+                'updated_at',
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.DateTime(),
+                postgresql_using="updated_at AT TIME ZONE 'UTC'",
+                server_default=None,
+                nullable=True,
+            )
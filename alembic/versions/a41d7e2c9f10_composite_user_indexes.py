@@ -0,0 +1,35 @@
+"""Composite indexes for per-user lookups
+
+Revision ID: a41d7e2c9f10
+Revises: 7c3e1f9a2b4d
+Create Date: 2026-10-15 23:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a41d7e2c9f10'
+down_revision = '7c3e1f9a2b4d'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ('ix_accounts_user_id_id', 'accounts', ['user_id', 'id']),
+    ('ix_categories_user_id_id', 'categories', ['user_id', 'id']),
+    ('ix_user_sessions_user_id_status', 'user_sessions', ['user_id', 'status']),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY avoids locking writes on Postgres but can't run in a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
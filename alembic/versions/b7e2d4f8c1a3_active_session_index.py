@@ -0,0 +1,39 @@
+"""Cover session expiry in the active-session index
+
+Revision ID: b7e2d4f8c1a3
+Revises: a41d7e2c9f10
+Create Date: 2026-10-15 23:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2d4f8c1a3'
+down_revision = 'a41d7e2c9f10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build the wider index before dropping the old one so lookups never lose coverage
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_sessions_user_id_status_expires_at', 'user_sessions',
+            ['user_id', 'status', 'expires_at'], postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_user_sessions_user_id_status', table_name='user_sessions', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_sessions_user_id_status', 'user_sessions',
+            ['user_id', 'status'], postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_user_sessions_user_id_status_expires_at', table_name='user_sessions',
+            postgresql_concurrently=True
+        )
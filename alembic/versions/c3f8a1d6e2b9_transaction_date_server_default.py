@@ -0,0 +1,44 @@
+"""Server-side default for transactions.transaction_date
+
+Revision ID: c3f8a1d6e2b9
+Revises: b7e2d4f8c1a3
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f8a1d6e2b9'
+down_revision = 'b7e2d4f8c1a3'
+branch_labels = None
+depends_on = None
+
+
+def _utc_now_default() -> sa.TextClause:
+    # The column is naive UTC; now() would store server local time on Postgres and MySQL
+    return sa.text({
+        'postgresql': "timezone('utc', now())",
+        'mysql': '(UTC_TIMESTAMP())',
+    }.get(op.get_bind().dialect.name, 'CURRENT_TIMESTAMP'))
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.alter_column(
+            'transaction_date',
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=_utc_now_default(),
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.alter_column(
+            'transaction_date',
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
@@ -0,0 +1,79 @@
+"""Shared fixtures for router tests against an in-memory database."""
+
+import asyncio
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.pool import StaticPool
+
+from truledgr_api.database import get_async_db, get_async_session_factory
+from truledgr_api.models.user import User
+from truledgr_api.utils.auth import get_current_user
+
+
+async def _create_tables(engine):
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+
+@pytest.fixture(name="memory_engine")
+def memory_engine_fixture():
+    """Create an in-memory database engine with all tables."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    asyncio.run(_create_tables(engine))
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture(name="session_factory")
+def session_factory_fixture(memory_engine):
+    """Open sessions on the in-memory database."""
+    return async_sessionmaker(memory_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture(name="seed")
+def seed_fixture(session_factory):
+    """Insert rows in the order given, flushing each so later rows can reference it."""
+    def seed(*rows):
+        async def insert():
+            async with session_factory() as session:
+                for row in rows:
+                    session.add(row)
+                    await session.flush()
+                await session.commit()
+
+        asyncio.run(insert())
+
+    return seed
+
+
+@pytest.fixture(name="owner")
+def owner_fixture(seed):
+    """Create the user router tests act as."""
+    user = User(username="owner", email="owner@example.com", hashed_password="x")
+    seed(user)
+    return user
+
+
+@pytest.fixture(name="router_client")
+def router_client_fixture(session_factory, owner):
+    """Build a client for a single router, signed in as ``owner``."""
+    async def get_session_override():
+        async with session_factory() as session:
+            yield session
+
+    def build(router: APIRouter, prefix: str) -> TestClient:
+        app = FastAPI()
+        app.include_router(router, prefix=prefix)
+        app.dependency_overrides[get_async_db] = get_session_override
+        app.dependency_overrides[get_async_session_factory] = lambda: session_factory
+        app.dependency_overrides[get_current_user] = lambda: owner
+        return TestClient(app)
+
+    return build
@@ -1,9 +1,16 @@
 """Test account models and currency validation."""
 
+import json
+from decimal import Decimal
+
 import pytest
 from pydantic import ValidationError
 
-from truledgr_api.models.account import AccountCreate, AccountUpdate, AccountType
+from truledgr_api.models.account import Account, AccountCreate, AccountUpdate, AccountType
+from truledgr_api.models.category import Category
+from truledgr_api.models.transaction import Transaction
+from truledgr_api.models.user import User
+from truledgr_api.routers.accounts import router
 
 
 def test_valid_currency_codes():
@@ -84,3 +91,83 @@ def test_account_creation_defaults():
     assert account.account_type == AccountType.CHECKING
     assert account.balance == 0.0
     assert account.is_primary is False
+
+
+def test_account_type_catalog():
+    """Test that the precomputed account type catalog covers every type."""
+    import orjson
+    from truledgr_api.models.account import ACCOUNT_TYPE_INFOS, ACCOUNT_TYPE_INFOS_JSON
+
+    assert [info.type for info in ACCOUNT_TYPE_INFOS] == list(AccountType)
+    payload = orjson.loads(ACCOUNT_TYPE_INFOS_JSON)
+    assert payload[2] == {
+        "type": "credit_card",
+        "name": "Credit Card",
+        "description": ACCOUNT_TYPE_INFOS[2].description,
+    }
+
+
+def test_delete_account_with_transactions(seed, owner, router_client):
+    """Test that an account with transactions can't be deleted out from under them."""
+    used = Account(user_id=owner.id, name="Checking")
+    unused = Account(user_id=owner.id, name="Savings")
+    category = Category(user_id=owner.id, name="Groceries")
+    transaction = Transaction(
+        user_id=owner.id, account_id=used.id, category_id=category.id,
+        amount=Decimal("12.50"), description="Market"
+    )
+    seed(used, unused, category, transaction)
+    client = router_client(router, "/accounts")
+
+    response = client.delete(f"/accounts/{used.id}")
+    assert response.status_code == 409
+    assert client.get(f"/accounts/{used.id}").status_code == 200
+
+    assert client.delete(f"/accounts/{unused.id}").status_code == 204
+    assert client.get(f"/accounts/{unused.id}").status_code == 404
+
+
+def test_export_accounts(seed, owner, router_client):
+    """Test that the export streams one JSON line per account."""
+    accounts = [Account(user_id=owner.id, name="Checking"), Account(user_id=owner.id, name="Savings")]
+    seed(*accounts)
+    client = router_client(router, "/accounts")
+
+    response = client.get("/accounts/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    exported = [json.loads(line)["id"] for line in response.text.splitlines()]
+    assert exported == sorted(account.id for account in accounts)
+
+
+def test_read_accounts_pages_with_cursor(seed, owner, router_client):
+    """Test that following next_cursor walks every account once, in id order."""
+    other = User(username="other", email="other@example.com", hashed_password="x")
+    accounts = [Account(user_id=owner.id, name=f"Account {n}") for n in range(5)]
+    seed(other, Account(user_id=other.id, name="Not mine"), *accounts)
+    client = router_client(router, "/accounts")
+
+    pages = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/accounts/", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        pages.append([item["id"] for item in page["items"]])
+        if page["next_cursor"] is None:
+            break
+        assert page["next_cursor"] == pages[-1][-1]
+        params = {"limit": 2, "cursor": page["next_cursor"]}
+
+    assert [len(ids) for ids in pages] == [2, 2, 1]
+    assert [account_id for ids in pages for account_id in ids] == sorted(account.id for account in accounts)
+
+
+def test_read_accounts_limit_bounds(owner, router_client):
+    """Test that limit is accepted from 1 to 1000 and rejected outside that."""
+    client = router_client(router, "/accounts")
+
+    assert client.get("/accounts/", params={"limit": 1}).status_code == 200
+    assert client.get("/accounts/", params={"limit": 1000}).status_code == 200
+    assert client.get("/accounts/", params={"limit": 0}).status_code == 422
+    assert client.get("/accounts/", params={"limit": 1001}).status_code == 422
@@ -0,0 +1,54 @@
+"""Test the in-process authenticated user cache."""
+
+import asyncio
+import time
+
+from truledgr_api.models.user import User
+from truledgr_api.utils import auth_cache
+
+
+def test_cached_user_round_trip_and_invalidation():
+    """Cached users come back as fresh objects and drop out when invalidated."""
+    user = User(id="user-1", username="alice", email="alice@example.com", hashed_password="hash")
+    exp = int(time.time()) + 60
+
+    async def scenario():
+        await auth_cache.cache_user("token-a", "session-a", exp, user)
+        await auth_cache.cache_user("token-b", "session-b", exp, user)
+
+        cached = await auth_cache.get_cached_user("token-a")
+        assert cached is not None and cached is not user
+        assert cached.username == "alice"
+        assert cached.hashed_password == ""
+
+        await auth_cache.forget_session("session-a")
+        assert await auth_cache.get_cached_user("token-a") is None
+        assert await auth_cache.get_cached_user("token-b") is not None
+
+        await auth_cache.forget_user("user-1")
+        assert await auth_cache.get_cached_user("token-b") is None
+
+        await auth_cache.cache_user("token-c", "session-c", int(time.time()) - 1, user)
+        assert await auth_cache.get_cached_user("token-c") is None
+
+    asyncio.run(scenario())
+
+
+def test_failed_revocation_write_is_raised(monkeypatch):
+    """A revocation Redis couldn't record must fail rather than be dropped."""
+    from datetime import datetime, timedelta, timezone
+
+    import pytest
+
+    class UnreachableRedis:
+        async def smembers(self, key):
+            raise ConnectionError("redis down")
+
+        async def set(self, *args, **kwargs):
+            raise ConnectionError("redis down")
+
+    monkeypatch.setattr(auth_cache, "_redis_client", UnreachableRedis())
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    with pytest.raises(OSError):
+        asyncio.run(auth_cache.mark_session_revoked("session-z", expires_at))
@@ -66,3 +66,16 @@ def test_category_hierarchy():
     
     assert parent.parent_id is None
     assert child.parent_id == "parent_id_placeholder"
+
+
+def test_category_types_endpoint():
+    """Test that the category type catalog is served from the prebuilt payload."""
+    from fastapi.testclient import TestClient
+    from truledgr_api.main import app
+
+    client = TestClient(app)
+    response = client.get("/categories/types")
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["type"] for item in data] == [t.value for t in CategoryType]
+    assert data[0]["name"] == "Debit"
@@ -0,0 +1,15 @@
+"""Test coalesced list reads."""
+
+from truledgr_api.models.institution import Institution
+from truledgr_api.routers.institutions import router
+
+
+def test_coalesced_reads_use_overridden_database(seed, owner, router_client):
+    """Shared list queries run against the overridden session factory."""
+    institution = Institution(user_id=owner.id, name="First Bank")
+    seed(institution)
+    client = router_client(router, "/institutions")
+
+    response = client.get("/institutions/")
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == [institution.id]
@@ -1,8 +1,12 @@
 """Test database configuration and models."""
 
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, create_engine, SQLModel
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel.pool import StaticPool
 
 from truledgr_api.main import create_app
@@ -11,24 +15,28 @@ from truledgr_api.models.user import User, UserCreate
 from truledgr_api.apps.users import create_users_app
 
 
-@pytest.fixture(name="session")
-def session_fixture():
-    """Create a test database session."""
-    engine = create_engine(
-        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+async def _create_tables(engine):
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+
+@pytest.fixture(name="engine")
+def engine_fixture():
+    """Create a test database engine."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
     )
     # Create all tables for testing
-    from sqlmodel import SQLModel
-    SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
-        yield session
+    asyncio.run(_create_tables(engine))
+    yield engine
 
 
 @pytest.fixture(name="client")
-def client_fixture(session: Session):
+def client_fixture(engine):
     """Create a test client with test database."""
-    def get_session_override():
-        yield session
+    async def get_session_override():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
 
     # Create a fresh app for testing with custom database dependency
     from fastapi import FastAPI
@@ -5,6 +5,7 @@ from typing import Callable
 
 from ..database import get_db
 from ..routers.auth import router as auth_router
+from ..utils.responses import JSON_RESPONSE_OPTIONS
 from .. import __version__
 
 
@@ -14,6 +15,7 @@ def create_auth_app(db_dependency: Callable = get_db) -> FastAPI:
         title="TruLedgr API - Authentication",
         description="Authentication endpoints for login, logout, session management, and OAuth.\n\n🏠 <a href='/' target='_self'>← Back to API Index</a>",
         version=__version__,
+        **JSON_RESPONSE_OPTIONS,
     )
 
     # Include auth router
@@ -5,6 +5,7 @@ from typing import Callable
 
 from ..database import get_db
 from ..routers.categories import router as categories_router
+from ..utils.responses import JSON_RESPONSE_OPTIONS
 from .. import __version__
 
 
@@ -14,6 +15,7 @@ def create_categories_app(db_dependency: Callable = get_db) -> FastAPI:
         title="TruLedgr API - Categories",
         description="Category management endpoints for transaction categorization and budgeting.\n\n🏠 <a href='/' target='_self'>← Back to API Index</a>",
         version=__version__,
+        **JSON_RESPONSE_OPTIONS,
     )
 
     # Include categories router
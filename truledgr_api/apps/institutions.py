@@ -5,6 +5,7 @@ from typing import Callable
 
 from ..database import get_db
 from ..routers.institutions import router as institutions_router
+from ..utils.responses import JSON_RESPONSE_OPTIONS
 from .. import __version__
 
 
@@ -14,6 +15,7 @@ def create_institutions_app(db_dependency: Callable = get_db) -> FastAPI:
         title="TruLedgr API - Institutions",
         description="Institution management endpoints for financial institutions with full CRUD operations.\n\n🏠 <a href='/' target='_self'>← Back to API Index</a>",
         version=__version__,
+        **JSON_RESPONSE_OPTIONS,
     )
 
     # Include institutions router
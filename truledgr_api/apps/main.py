@@ -6,13 +6,18 @@ from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.openapi.utils import get_openapi
 import json
 import importlib
+import logging
 import os
 from pathlib import Path
 
 from ..config import settings
+from ..database import warm_up_pool
 from ..routers import health
+from ..utils.responses import JSON_RESPONSE_OPTIONS
 from .. import __version__
 
+logger = logging.getLogger(__name__)
+
 
 def discover_sub_apps():
     """Dynamically discover all sub-app modules and their create functions."""
@@ -51,6 +56,10 @@ def discover_sub_apps():
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup - migrations should be run separately with `alembic upgrade head`
+    try:
+        await warm_up_pool()
+    except Exception:
+        logger.warning("Failed to warm up database connection pool", exc_info=True)
     yield
     # Shutdown (if needed)
 
@@ -61,6 +70,7 @@ def create_app() -> FastAPI:
         description="A comprehensive ledger management system.\n\n🏠 <a href='/' target='_self'>← Back to API Index</a>",
         version=__version__,
         lifespan=lifespan,
+        **JSON_RESPONSE_OPTIONS,
     )
 
     @app.get("/", response_class=HTMLResponse)
@@ -5,6 +5,7 @@ from typing import Callable
 
 from ..database import get_db
 from ..routers.payees import router as payees_router
+from ..utils.responses import JSON_RESPONSE_OPTIONS
 from .. import __version__
 
 
@@ -14,6 +15,7 @@ def create_payees_app(db_dependency: Callable = get_db) -> FastAPI:
         title="TruLedgr API - Payees",
         description="Payee management endpoints for transaction payees/merchants.\n\n🏠 <a href='/' target='_self'>← Back to API Index</a>",
         version=__version__,
+        **JSON_RESPONSE_OPTIONS,
     )
 
     # Include payees router
@@ -1,14 +1,24 @@
 """Users subapp with all user-related endpoints."""
 
 from fastapi import FastAPI, Depends, HTTPException, status
-from sqlmodel import Session, select
+from sqlalchemy import bindparam
+from sqlalchemy.orm import raiseload
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List, Callable
 
 from ..database import get_db
 from ..models.user import User, UserCreate, UserRead, UserUpdate
-from ..utils.auth import get_current_user
+from ..utils.auth import get_current_user, get_password_hash_async
+from ..utils.crud import update_record
+from ..utils.auth_cache import forget_user
+from ..utils.users import ensure_user_is_new
+from ..utils.responses import JSON_RESPONSE_OPTIONS
 from .. import __version__
 
+# Built once at import; per-request values are bound at execution time
+_SELECT_USER_BY_ID = select(User).options(raiseload("*")).where(User.id == bindparam("user_id"))
+
 
 def create_users_app(db_dependency: Callable = get_db) -> FastAPI:
     """Create and configure the users subapp."""
@@ -16,41 +26,26 @@ def create_users_app(db_dependency: Callable = get_db) -> FastAPI:
         title="TruLedgr API - Users",
         description="User management endpoints with full CRUD operations and public signup.\n\n🏠 <a href='/' target='_self'>← Back to API Index</a>",
         version=__version__,
+        **JSON_RESPONSE_OPTIONS,
     )
 
     @users_app.post("/signup", response_model=UserRead, status_code=status.HTTP_201_CREATED, tags=["User Profile"])
-    async def signup(user: UserCreate, db: Session = Depends(db_dependency)):
+    async def signup(user: UserCreate, db: AsyncSession = Depends(db_dependency)):
         """User signup endpoint for public registration."""
-        # Check if user already exists
-        statement = select(User).where(User.username == user.username)
-        existing_user = db.exec(statement).first()
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already registered"
-            )
-        
-        # Check if email already exists
-        statement = select(User).where(User.email == user.email)
-        existing_email = db.exec(statement).first()
-        if existing_email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
+        await ensure_user_is_new(db, user)
         
-        # Create new user (in real app, hash the password)
+        # Create new user
         db_user = User(
             username=user.username,
             email=user.email,
             full_name=user.full_name,
-            hashed_password=user.password,  # In real app: hash_password(user.password)
+            hashed_password=await get_password_hash_async(user.password),
             is_active=True
         )
         
+        # Server defaults come back via RETURNING, so no refresh is needed
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
         
         return db_user
 
@@ -63,39 +58,23 @@ def create_users_app(db_dependency: Callable = get_db) -> FastAPI:
     async def create_user(
         user: UserCreate, 
         current_user: User = Depends(get_current_user),
-        db: Session = Depends(db_dependency)
+        db: AsyncSession = Depends(db_dependency)
     ):
         """Create a new user (admin endpoint)."""
-        # Check if user already exists
-        statement = select(User).where(User.username == user.username)
-        existing_user = db.exec(statement).first()
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already registered"
-            )
-        
-        # Check if email already exists
-        statement = select(User).where(User.email == user.email)
-        existing_email = db.exec(statement).first()
-        if existing_email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
+        await ensure_user_is_new(db, user)
         
-        # Create new user (in real app, hash the password)
+        # Create new user
         db_user = User(
             username=user.username,
             email=user.email,
             full_name=user.full_name,
-            hashed_password=user.password,  # In real app: hash_password(user.password)
+            hashed_password=await get_password_hash_async(user.password),
             is_active=True
         )
         
+        # Server defaults come back via RETURNING, so no refresh is needed
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
         
         return db_user
 
@@ -104,22 +83,21 @@ def create_users_app(db_dependency: Callable = get_db) -> FastAPI:
         skip: int = 0, 
         limit: int = 100, 
         current_user: User = Depends(get_current_user),
-        db: Session = Depends(db_dependency)
+        db: AsyncSession = Depends(db_dependency)
     ):
         """Get all users."""
-        statement = select(User).offset(skip).limit(limit)
-        users = db.exec(statement).all()
+        statement = select(User).options(raiseload("*")).offset(skip).limit(limit)
+        users = (await db.exec(statement)).all()
         return users
 
     @users_app.get("/{user_id}", response_model=UserRead, tags=["User Management"])
     async def read_user(
         user_id: str, 
         current_user: User = Depends(get_current_user),
-        db: Session = Depends(db_dependency)
+        db: AsyncSession = Depends(db_dependency)
     ):
         """Get a specific user by ID."""
-        statement = select(User).where(User.id == user_id)
-        user = db.exec(statement).first()
+        user = (await db.exec(_SELECT_USER_BY_ID, params={"user_id": user_id})).first()
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -132,28 +110,22 @@ def create_users_app(db_dependency: Callable = get_db) -> FastAPI:
         user_id: str, 
         user_update: UserUpdate, 
         current_user: User = Depends(get_current_user),
-        db: Session = Depends(db_dependency)
+        db: AsyncSession = Depends(db_dependency)
     ):
         """Update a user."""
-        statement = select(User).where(User.id == user_id)
-        db_user = db.exec(statement).first()
+        user_data = user_update.model_dump(exclude_unset=True)
+        if "password" in user_data:
+            user_data["hashed_password"] = await get_password_hash_async(user_data.pop("password"))
+        
+        db_user = await update_record(db, User, user_data, User.id == user_id)
         if not db_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
-        # Update only provided fields
-        user_data = user_update.model_dump(exclude_unset=True)
-        if "password" in user_data:
-            # In real app: user_data["hashed_password"] = hash_password(user_data.pop("password"))
-            user_data["hashed_password"] = user_data.pop("password")
-        
-        for field, value in user_data.items():
-            setattr(db_user, field, value)
-        
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await forget_user(user_id)
         
         return db_user
 
@@ -161,19 +133,20 @@ def create_users_app(db_dependency: Callable = get_db) -> FastAPI:
     async def delete_user(
         user_id: str, 
         current_user: User = Depends(get_current_user),
-        db: Session = Depends(db_dependency)
+        db: AsyncSession = Depends(db_dependency)
     ):
         """Delete a user."""
         statement = select(User).where(User.id == user_id)
-        user = db.exec(statement).first()
+        user = (await db.exec(statement)).first()
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
-        db.delete(user)
-        db.commit()
+        await db.delete(user)
+        await db.commit()
+        await forget_user(user_id)
         
         return None
 
@@ -1,6 +1,6 @@
 import os
 import warnings
-from typing import get_type_hints
+from typing import Optional, get_type_hints
 
 _using_base_model_fallback = False
 try:
@@ -32,11 +32,24 @@ class Settings(BaseSettings):
     # Database settings - REQUIRED (async by default)
     database_url: str
     
+    # Connection pool settings (ignored for SQLite)
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle: int = 1800  # seconds
+    db_pool_timeout: int = 30  # seconds to wait for a free connection
+    # Set when an external pooler such as PgBouncer (transaction mode) sits in front
+    db_external_pooler: bool = False
+    
     # JWT settings
     secret_key: str = "your-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
+    # bcrypt cost factor for new hashes; each +1 doubles hashing time
+    bcrypt_rounds: int = 10
+    
+    # Optional Redis for caches shared across workers (requires the redis package)
+    redis_url: Optional[str] = None
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -57,6 +70,8 @@ class Settings(BaseSettings):
             return url.replace("sqlite://", "sqlite+aiosqlite://")
         elif url.startswith("postgresql://"):
             return url.replace("postgresql://", "postgresql+asyncpg://")
+        elif url.startswith("postgres://"):
+            return url.replace("postgres://", "postgresql+asyncpg://")
         elif url.startswith("mysql://"):
             return url.replace("mysql://", "mysql+aiomysql://")
         else:
@@ -1,15 +1,62 @@
 """Database configuration and session management (async-first)."""
 
+import asyncio
+from typing import AsyncContextManager, Callable
+
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from sqlmodel import SQLModel, create_engine, Session
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from .config import settings
 
 
+def _async_connect_args(url: str) -> dict:
+    """Driver-specific connect arguments for the async engine."""
+    if url.startswith("sqlite"):
+        return {"check_same_thread": False}
+    if url.startswith("postgresql+asyncpg"):
+        if settings.db_external_pooler:
+            # Transaction-mode poolers hand each transaction a different backend,
+            # so prepared statements can't be reused across them
+            return {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        return {
+            # Keep prepared statements around so repeated queries skip planning
+            "statement_cache_size": 1000,
+            "prepared_statement_cache_size": 1000,
+            "server_settings": {"jit": "off", "application_name": "truledgr_api"},
+        }
+    return {}
+
+
+def _async_pool_args(url: str) -> dict:
+    """Connection pool sizing for the async engine.
+
+    SQLite keeps SQLAlchemy's defaults; its pools aren't sized this way.
+    Behind an external pooler each checkout opens a fresh (cheap) connection
+    so the two pools don't stack.
+    """
+    if url.startswith("sqlite"):
+        return {}
+    if settings.db_external_pooler:
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
+
+
 # Create async engine (primary)
 async_engine = create_async_engine(
     settings.database_url,  # Already async by default
     echo=settings.debug,
-    connect_args={"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
+    connect_args=_async_connect_args(settings.database_url),
+    **_async_pool_args(settings.database_url)
 )
 
 # Create sync engine (fallback/compatibility)
@@ -19,6 +66,26 @@ engine = create_engine(
     connect_args={"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
 )
 
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply performance PRAGMAs to every new SQLite connection.
+
+    WAL lets readers proceed while a writer is active, and synchronous=NORMAL
+    is durable under WAL while issuing far fewer fsyncs than the FULL default.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.execute("PRAGMA cache_size=-64000")  # ~64 MB page cache
+    cursor.close()
+
+
+if settings.database_url.startswith("sqlite"):
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
 # Create sessionmaker for async sessions
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
@@ -35,6 +102,20 @@ async def create_db_and_tables():
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
+async def warm_up_pool(connections: int = 5):
+    """Open pool connections up front so early requests skip the connect handshake."""
+    pool_size = getattr(async_engine.pool, "size", None)
+    if isinstance(async_engine.pool, NullPool) or not callable(pool_size):
+        return  # nothing would be kept, e.g. behind an external pooler
+    connections = min(connections, pool_size())
+    if connections <= 0:
+        return
+
+    conns = await asyncio.gather(*(async_engine.connect() for _ in range(connections)))
+    # Closing hands the connections back to the pool rather than dropping them
+    await asyncio.gather(*(conn.close() for conn in conns))
+
+
 def create_db_and_tables_sync():
     """Create database tables (sync fallback)."""
     SQLModel.metadata.create_all(engine)
@@ -52,14 +133,33 @@ async def get_async_session():
         yield session
 
 
-# Database dependency for FastAPI
-def get_db():
-    """FastAPI dependency for database session."""
-    with Session(engine) as session:
-        yield session
-
-
 async def get_async_db():
     """FastAPI dependency for async database session."""
     async with AsyncSessionLocal() as session:
         yield session
+
+
+# Database dependency for FastAPI. An alias rather than a copy, so overriding
+# either name swaps the session for every route, auth included.
+get_db = get_async_db
+
+
+# Opens a session outside any request, e.g. ``async with open_session() as db``
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+async def get_async_session_factory(
+    db: AsyncSession = Depends(get_async_db),
+) -> SessionFactory:
+    """FastAPI dependency for opening sessions that outlive the request.
+
+    Work such as shared reads and streamed bodies can't borrow the request's
+    session, which closes with the request, so it opens its own from this
+    factory. Override this dependency to point that work at another database.
+
+    The request's session is closed first, so a connection taken for
+    authentication goes back to the pool rather than being held while the
+    factory checks out a second one. Declare it after ``get_current_user``.
+    """
+    await db.close()
+    return AsyncSessionLocal
@@ -1,20 +1,66 @@
 """Base models and common model utilities."""
 
 from sqlmodel import SQLModel, Field
+from sqlalchemy import DateTime, func
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from pydantic import ConfigDict
 from typing import Optional
-from datetime import datetime, timezone
+from datetime import datetime
 from ulid import ULID
 
 
+class utcnow(FunctionElement):
+    """Current UTC time for naive ``DateTime`` columns, evaluated by the database.
+
+    ``now()`` fills a naive column with the server's local wall-clock time on
+    Postgres and MySQL, which wouldn't match the UTC values the app writes.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"  # UTC on SQLite
+
+
+@compiles(utcnow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+
+@compiles(utcnow, "mysql")
+def _compile_utcnow_mysql(element, compiler, **kw):
+    return "(UTC_TIMESTAMP())"
+
+
 def generate_ulid() -> str:
     """Generate a new ULID as a string."""
     return str(ULID())
 
 
 class TimestampMixin(SQLModel):
-    """Mixin to add created_at and updated_at timestamps."""
-    created_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(timezone.utc))
+    """Mixin to add created_at and updated_at timestamps.
+
+    Both are filled in by the database, and updated_at is refreshed on every UPDATE.
+    Eager defaults fetch them back in the INSERT/UPDATE itself (RETURNING where
+    the backend has it), so callers don't need a follow-up refresh.
+    """
+    __mapper_args__ = {"eager_defaults": True}
+
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
+    )
 
 
 class BaseModel(TimestampMixin):
@@ -22,6 +68,15 @@ class BaseModel(TimestampMixin):
     id: Optional[str] = Field(default_factory=generate_ulid, primary_key=True)
 
 
+class ReadSchema(SQLModel):
+    """Base for read-only response schemas.
+
+    Instances are built once per response and never mutated, so they are frozen.
+    Enum fields keep their plain string value so encoding them is a straight copy.
+    """
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+
+
 # Import all models to ensure they're registered with SQLModel
 from .user import User
 from .auth import (
@@ -43,6 +98,7 @@ from .account import (
     AccountStatus,
     AccountCreate,
     AccountRead,
+    AccountPage,
     AccountUpdate,
     AccountTypeInfo
 )
@@ -70,6 +126,7 @@ from .category import (
     CategoryType,
     CategoryCreate,
     CategoryRead,
+    CategoryPage,
     CategoryUpdate,
     CategoryTypeInfo
 )
@@ -84,6 +141,7 @@ from .payee import (
 __all__ = [
     "BaseModel", 
     "TimestampMixin", 
+    "ReadSchema",
     "User",
     "UserSession",
     "UserOAuthAccount", 
@@ -101,6 +159,7 @@ __all__ = [
     "AccountStatus",
     "AccountCreate",
     "AccountRead",
+    "AccountPage",
     "AccountUpdate",
     "AccountTypeInfo",
     "Transaction",
@@ -122,6 +181,7 @@ __all__ = [
     "CategoryType",
     "CategoryCreate",
     "CategoryRead",
+    "CategoryPage",
     "CategoryUpdate",
     "CategoryTypeInfo",
     "Payee",
@@ -1,13 +1,15 @@
 """Account models and schemas."""
 
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime, timezone
 from enum import Enum
+import orjson
 import pycountry
 from pydantic import field_validator
 
-from . import BaseModel
+from . import BaseModel, ReadSchema
 
 if TYPE_CHECKING:
     from .user import User
@@ -39,6 +41,7 @@ class Account(BaseModel, table=True):
     """Account table."""
 
     __tablename__ = "accounts"
+    __table_args__ = (Index("ix_accounts_user_id_id", "user_id", "id"),)
 
     user_id: str = Field(foreign_key="users.id", index=True)
     institution_id: Optional[str] = Field(default=None, foreign_key="institutions.id", index=True)
@@ -93,7 +96,7 @@ class AccountCreate(SQLModel):
         return v
 
 
-class AccountRead(SQLModel):
+class AccountRead(ReadSchema):
     """Account read schema."""
     id: str
     user_id: str
@@ -111,6 +114,12 @@ class AccountRead(SQLModel):
     updated_at: datetime
 
 
+class AccountPage(ReadSchema):
+    """One page of accounts; pass ``next_cursor`` back as ``cursor`` for the next one."""
+    items: List[AccountRead]
+    next_cursor: Optional[str] = None
+
+
 class AccountUpdate(SQLModel):
     """Account update schema."""
     institution_id: Optional[str] = None
@@ -149,4 +158,28 @@ class AccountTypeInfo(SQLModel):
     """Account type information."""
     type: AccountType
     name: str
-    description: str
\ No newline at end of file
+    description: str
+
+
+ACCOUNT_TYPE_DESCRIPTIONS = {
+    AccountType.CHECKING: "Everyday transactional account for deposits and payments.",
+    AccountType.SAVINGS: "Interest-bearing account for setting money aside.",
+    AccountType.CREDIT_CARD: "Revolving credit line used for card purchases.",
+    AccountType.INVESTMENT: "Brokerage or retirement account holding securities.",
+    AccountType.LOAN: "Installment debt such as an auto or personal loan.",
+    AccountType.MORTGAGE: "Loan secured against real estate.",
+    AccountType.OTHER: "Any account that does not fit another type.",
+}
+
+# The catalog is static, so build it (and its JSON encoding) once at import.
+ACCOUNT_TYPE_INFOS: List[AccountTypeInfo] = [
+    AccountTypeInfo(
+        type=account_type,
+        name=account_type.value.replace("_", " ").title(),
+        description=ACCOUNT_TYPE_DESCRIPTIONS[account_type],
+    )
+    for account_type in AccountType
+]
+ACCOUNT_TYPE_INFOS_JSON: bytes = orjson.dumps(
+    [info.model_dump(mode="json") for info in ACCOUNT_TYPE_INFOS]
+)
@@ -1,12 +1,12 @@
 """Authentication models and schemas."""
 
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
 from enum import Enum
-from ulid import ULID
 
-from . import BaseModel
+from . import BaseModel, ReadSchema
 
 if TYPE_CHECKING:
     from .user import User
@@ -31,6 +31,7 @@ class UserSession(BaseModel, table=True):
     """User session tracking table."""
     
     __tablename__ = "user_sessions"
+    __table_args__ = (Index("ix_user_sessions_user_id_status_expires_at", "user_id", "status", "expires_at"),)
     
     user_id: str = Field(foreign_key="users.id", index=True)
     session_token: str = Field(unique=True, index=True)
@@ -92,7 +93,7 @@ class RefreshTokenRequest(SQLModel):
     refresh_token: str
 
 
-class SessionInfo(SQLModel):
+class SessionInfo(ReadSchema):
     """Session information for monitoring."""
     id: str
     user_id: str
@@ -104,7 +105,7 @@ class SessionInfo(SQLModel):
     user_agent: Optional[str]
 
 
-class OAuthAccountInfo(SQLModel):
+class OAuthAccountInfo(ReadSchema):
     """OAuth account information."""
     id: str
     provider: OAuthProvider
@@ -113,7 +114,7 @@ class OAuthAccountInfo(SQLModel):
     token_expires_at: Optional[datetime]
 
 
-class UserAuthInfo(SQLModel):
+class UserAuthInfo(ReadSchema):
     """User authentication information."""
     id: str
     username: str
@@ -163,7 +164,7 @@ class EndImpersonationRequest(SQLModel):
     impersonation_session_id: Optional[str] = None  # If None, ends current session
 
 
-class ImpersonationInfo(SQLModel):
+class ImpersonationInfo(ReadSchema):
     """Information about an impersonation session."""
     id: str
     admin_user_id: str
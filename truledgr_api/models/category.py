@@ -1,12 +1,13 @@
 """Category models and schemas for transactions and budgeting."""
 
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime, timezone
 from enum import Enum
-from ulid import ULID
+import orjson
 
-from . import BaseModel
+from . import BaseModel, ReadSchema
 
 if TYPE_CHECKING:
     from .user import User
@@ -31,6 +32,7 @@ class Category(BaseModel, table=True):
     """Category table for transactions and budgeting."""
 
     __tablename__ = "categories"
+    __table_args__ = (Index("ix_categories_user_id_id", "user_id", "id"),)
 
     user_id: str = Field(foreign_key="users.id", index=True)
     name: str = Field(max_length=100)
@@ -61,7 +63,7 @@ class CategoryCreate(SQLModel):
     parent_id: Optional[str] = None
 
 
-class CategoryRead(SQLModel):
+class CategoryRead(ReadSchema):
     """Category read schema."""
     id: str
     user_id: str
@@ -75,6 +77,12 @@ class CategoryRead(SQLModel):
     updated_at: datetime
 
 
+class CategoryPage(ReadSchema):
+    """One page of categories; pass ``next_cursor`` back as ``cursor`` for the next one."""
+    items: List[CategoryRead]
+    next_cursor: Optional[str] = None
+
+
 class CategoryUpdate(SQLModel):
     """Category update schema."""
     name: Optional[str] = None
@@ -90,3 +98,30 @@ class CategoryTypeInfo(SQLModel):
     type: CategoryType
     name: str
     description: str
+
+
+CATEGORY_TYPE_DESCRIPTIONS = {
+    CategoryType.DEBIT: "Money leaving an account, such as a purchase.",
+    CategoryType.CREDIT: "Money entering an account, such as a refund.",
+    CategoryType.TRANSFER: "Movement of money between your own accounts.",
+    CategoryType.PAYMENT: "Payment toward a bill, loan or credit card.",
+    CategoryType.FEE: "Bank, service or late fee.",
+    CategoryType.INTEREST: "Interest earned or charged.",
+    CategoryType.DIVIDEND: "Dividend paid by an investment.",
+    CategoryType.ADJUSTMENT: "Manual correction to an account balance.",
+    CategoryType.INCOME: "Salary, wages or other earnings.",
+    CategoryType.OTHER: "Any category that does not fit another type.",
+}
+
+# The catalog is static, so build it (and its JSON encoding) once at import.
+CATEGORY_TYPE_INFOS: List[CategoryTypeInfo] = [
+    CategoryTypeInfo(
+        type=category_type,
+        name=category_type.value.replace("_", " ").title(),
+        description=CATEGORY_TYPE_DESCRIPTIONS[category_type],
+    )
+    for category_type in CategoryType
+]
+CATEGORY_TYPE_INFOS_JSON: bytes = orjson.dumps(
+    [info.model_dump(mode="json") for info in CATEGORY_TYPE_INFOS]
+)
@@ -4,9 +4,9 @@ from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime, timezone
 from enum import Enum
-from ulid import ULID
+import orjson
 
-from . import BaseModel
+from . import BaseModel, ReadSchema
 
 if TYPE_CHECKING:
     from .user import User
@@ -67,7 +67,7 @@ class InstitutionCreate(SQLModel):
     description: Optional[str] = None
 
 
-class InstitutionRead(SQLModel):
+class InstitutionRead(ReadSchema):
     """Institution read schema."""
     id: str
     user_id: str
@@ -105,4 +105,26 @@ class InstitutionTypeInfo(SQLModel):
     """Institution type information."""
     type: InstitutionType
     name: str
-    description: str
\ No newline at end of file
+    description: str
+
+
+INSTITUTION_TYPE_DESCRIPTIONS = {
+    InstitutionType.BANK: "Commercial or retail bank.",
+    InstitutionType.CREDIT_UNION: "Member-owned cooperative financial institution.",
+    InstitutionType.INVESTMENT_FIRM: "Brokerage, asset manager or retirement plan provider.",
+    InstitutionType.INSURANCE: "Insurance company holding policies or annuities.",
+    InstitutionType.OTHER: "Any institution that does not fit another type.",
+}
+
+# The catalog is static, so build it (and its JSON encoding) once at import.
+INSTITUTION_TYPE_INFOS: List[InstitutionTypeInfo] = [
+    InstitutionTypeInfo(
+        type=institution_type,
+        name=institution_type.value.replace("_", " ").title(),
+        description=INSTITUTION_TYPE_DESCRIPTIONS[institution_type],
+    )
+    for institution_type in InstitutionType
+]
+INSTITUTION_TYPE_INFOS_JSON: bytes = orjson.dumps(
+    [info.model_dump(mode="json") for info in INSTITUTION_TYPE_INFOS]
+)
@@ -4,7 +4,7 @@ from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime, timezone
 
-from . import BaseModel
+from . import BaseModel, ReadSchema
 
 if TYPE_CHECKING:
     from .user import User
@@ -48,7 +48,7 @@ class PayeeCreate(SQLModel):
     account_id: Optional[str] = None
 
 
-class PayeeRead(SQLModel):
+class PayeeRead(ReadSchema):
     """Payee read schema."""
     id: str
     user_id: str
@@ -2,12 +2,11 @@
 
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List, TYPE_CHECKING
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum
-from ulid import ULID
 from decimal import Decimal
 
-from . import BaseModel
+from . import BaseModel, ReadSchema, utcnow
 
 if TYPE_CHECKING:
     from .user import User
@@ -56,7 +55,12 @@ class Transaction(BaseModel, table=True):
     description: str = Field(max_length=500)
     category: TransactionCategory = Field(default=TransactionCategory.OTHER)
     status: TransactionStatus = Field(default=TransactionStatus.PENDING)
-    transaction_date: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Filled in by the database, in UTC, when the client doesn't send one
+    transaction_date: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": utcnow()},
+    )
     reference_number: Optional[str] = Field(default=None, max_length=100, unique=True)
     notes: Optional[str] = Field(default=None, max_length=1000)
 
@@ -81,7 +85,7 @@ class TransactionCreate(SQLModel):
     notes: Optional[str] = None
 
 
-class TransactionRead(SQLModel):
+class TransactionRead(ReadSchema):
     """Transaction read schema."""
     id: str
     user_id: str
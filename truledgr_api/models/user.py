@@ -3,7 +3,7 @@
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
-from . import BaseModel
+from . import BaseModel, ReadSchema
 from .auth import UserSession, UserOAuthAccount
 
 if TYPE_CHECKING:
@@ -57,7 +57,7 @@ class UserUpdate(SQLModel):
     password: Optional[str] = None
 
 
-class UserRead(UserBase):
+class UserRead(UserBase, ReadSchema):
     """User read schema (public)."""
     id: str
     created_at: Optional[datetime] = None
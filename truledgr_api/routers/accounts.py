@@ -1,22 +1,49 @@
 """Account router with CRUD operations."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import bindparam, exists
+from sqlmodel import delete, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional
 
-from ..database import get_db
-from ..models.account import Account, AccountCreate, AccountRead, AccountUpdate
+from ..database import SessionFactory, get_async_db, get_async_session_factory
+from ..models.account import (
+    Account,
+    AccountCreate,
+    AccountRead,
+    AccountPage,
+    AccountUpdate,
+    AccountTypeInfo,
+    ACCOUNT_TYPE_INFOS_JSON,
+)
+from ..models.payee import Payee
+from ..models.transaction import Transaction
 from ..utils.auth import get_current_user
+from ..utils.coalesce import forget_user_reads
+from ..utils.crud import update_owned_record
+from ..utils.ownership import forget_owned_record
+from ..utils.responses import ndjson_response
 from ..models.user import User
 
 router = APIRouter(tags=["Accounts"])
 
+# Built once at import; per-request values are bound at execution time
+_SELECT_OWNED_ACCOUNT = select(Account).where(
+    Account.id == bindparam("account_id"),
+    Account.user_id == bindparam("user_id")
+)
+_HAS_ACCOUNT_TRANSACTIONS = select(exists().where(
+    Transaction.account_id == bindparam("account_id"),
+    Transaction.user_id == bindparam("user_id")
+))
+
 
 @router.post("/", response_model=AccountRead, status_code=status.HTTP_201_CREATED)
 async def create_account(
     account: AccountCreate, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new account for the current user."""
     # Create new account
@@ -33,38 +60,57 @@ async def create_account(
         is_primary=account.is_primary
     )
     
+    # Server defaults come back via RETURNING, so no refresh is needed
     db.add(db_account)
-    db.commit()
-    db.refresh(db_account)
+    await db.commit()
     
     return db_account
 
 
-@router.get("/", response_model=List[AccountRead])
+@router.get("/", response_model=AccountPage)
 async def read_accounts(
-    skip: int = 0, 
-    limit: int = 100, 
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all accounts for the current user."""
-    statement = select(Account).where(Account.user_id == current_user.id).offset(skip).limit(limit)
-    accounts = db.exec(statement).all()
-    return accounts
+    """Get the current user's accounts, a page at a time in creation order."""
+    # Keyset pagination over (user_id, id); ULIDs sort by creation time
+    statement = select(Account).where(Account.user_id == current_user.id)
+    if cursor:
+        statement = statement.where(Account.id > cursor)
+    statement = statement.order_by(Account.id).limit(limit)
+    accounts = (await db.exec(statement)).all()
+    
+    next_cursor = accounts[-1].id if accounts and len(accounts) == limit else None
+    return AccountPage(items=accounts, next_cursor=next_cursor)
+
+
+@router.get("/types", response_model=List[AccountTypeInfo])
+async def read_account_types():
+    """Get the catalog of supported account types."""
+    return Response(content=ACCOUNT_TYPE_INFOS_JSON, media_type="application/json")
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_accounts(
+    current_user: User = Depends(get_current_user),
+    session_factory: SessionFactory = Depends(get_async_session_factory)
+):
+    """Stream all of the current user's accounts as newline-delimited JSON."""
+    statement = select(Account).where(Account.user_id == current_user.id).order_by(Account.id)
+    return ndjson_response(statement, AccountRead, session_factory)
 
 
 @router.get("/{account_id}", response_model=AccountRead)
 async def read_account(
     account_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific account by ID."""
-    statement = select(Account).where(
-        Account.id == account_id,
-        Account.user_id == current_user.id
-    )
-    account = db.exec(statement).first()
+    params = {"account_id": account_id, "user_id": current_user.id}
+    account = (await db.exec(_SELECT_OWNED_ACCOUNT, params=params)).first()
     if not account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -78,27 +124,20 @@ async def update_account(
     account_id: str,
     account_update: AccountUpdate, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an account."""
-    statement = select(Account).where(
-        Account.id == account_id,
-        Account.user_id == current_user.id
+    db_account = await update_owned_record(
+        db, Account, account_id, current_user.id,  # type: ignore
+        account_update.model_dump(exclude_unset=True)
     )
-    db_account = db.exec(statement).first()
     if not db_account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found"
         )
     
-    # Update only provided fields
-    account_data = account_update.model_dump(exclude_unset=True)
-    for field, value in account_data.items():
-        setattr(db_account, field, value)
-    
-    db.commit()
-    db.refresh(db_account)
+    await db.commit()
     
     return db_account
 
@@ -107,21 +146,38 @@ async def update_account(
 async def delete_account(
     account_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete an account."""
-    statement = select(Account).where(
-        Account.id == account_id,
-        Account.user_id == current_user.id
+    # Transactions require their account, so refuse rather than orphan them
+    params = {"account_id": account_id, "user_id": current_user.id}
+    if (await db.exec(_HAS_ACCOUNT_TRANSACTIONS, params=params)).one():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Account has transactions; delete or move them first"
+        )
+    
+    # Detach payees that point at the account, as the ORM delete used to do
+    await db.execute(
+        update(Payee)
+        .where(Payee.account_id == account_id, Payee.user_id == current_user.id)
+        .values(account_id=None)
     )
-    account = db.exec(statement).first()
-    if not account:
+    
+    result = await db.execute(
+        delete(Account).where(
+            Account.id == account_id,
+            Account.user_id == current_user.id
+        )
+    )
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found"
         )
     
-    db.delete(account)
-    db.commit()
+    await db.commit()
+    forget_user_reads(current_user.id)  # type: ignore
+    forget_owned_record(Account, account_id, current_user.id)  # type: ignore
     
     return None
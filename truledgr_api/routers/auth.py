@@ -1,23 +1,31 @@
 """Authentication endpoints for login, logout, and session management."""
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlmodel import Session, select
-from typing import List, Optional
-from datetime import datetime, timezone
+from sqlalchemy import bindparam
+from sqlmodel import select, update
+from sqlalchemy.orm import joinedload
+from sqlmodel.ext.asyncio.session import AsyncSession
+from datetime import timezone
+from typing import List, Optional, Sequence
 
-from ..database import get_db
+from ..database import get_async_db
 from ..utils.auth import (
     get_current_user, 
     create_user_session, 
     revoke_user_session,
     get_active_sessions,
-    verify_password,
+    verify_password_async,
     get_admin_dependency,
     create_impersonation_session,
     end_impersonation_session,
     get_current_user_with_impersonation,
-    get_impersonation_sessions
+    get_impersonation_sessions,
+    oauth2_scheme,
+    record_revocation,
+    _utcnow_naive,
+    touch_session
 )
+from ..utils.auth_cache import forget_token
 from ..models.user import User
 from ..models.auth import (
     LoginRequest, 
@@ -28,7 +36,6 @@ from ..models.auth import (
     UserAuthInfo,
     RevokeSessionRequest,
     UserSession,
-    UserOAuthAccount,
     SessionStatus,
     ImpersonateRequest,
     ImpersonateResponse,
@@ -40,18 +47,20 @@ from ..models.auth import (
 
 router = APIRouter()
 
+# Built once at import; per-request values are bound at execution time
+_SELECT_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+
 @router.post("/login", response_model=TokenResponse, tags=["Authentication"])
 async def login(
     request: LoginRequest, 
     req: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Authenticate user and create session."""
     # Find user
-    statement = select(User).where(User.username == request.username)
-    user = db.exec(statement).first()
+    user = (await db.exec(_SELECT_USER_BY_USERNAME, params={"username": request.username})).first()
     
-    if not user or not verify_password(request.password, user.hashed_password):
+    if not user or not await verify_password_async(request.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -71,7 +80,7 @@ async def login(
         )
     
     # Create session
-    access_token, refresh_token = create_user_session(
+    access_token, refresh_token = await create_user_session(
         db=db,
         user_id=user.id,
         ip_address=req.client.host if req.client else None,
@@ -91,7 +100,7 @@ async def login(
 @router.post("/refresh", response_model=TokenResponse, tags=["Authentication"])
 async def refresh_token(
     request: RefreshTokenRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Refresh access token using refresh token."""
     # Verify refresh token and get user
@@ -113,24 +122,20 @@ async def refresh_token(
             detail="Invalid refresh token"
         )
     
-    # Check if session is still active
-    statement = select(UserSession).where(
-        UserSession.session_token == session_token,
-        UserSession.status == SessionStatus.ACTIVE
-    )
-    session = db.exec(statement).first()
-    
-    if not session or session.expires_at < datetime.now(timezone.utc):
+    # Check that the session is still active and extend it in one statement
+    touched = await touch_session(db, session_token)
+    if touched is None or touched[0] != user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Session expired"
         )
+    await db.commit()
     
-    # Create new access token
+    # Create new access token carrying the extended session expiry
+    session_exp = touched[1].replace(tzinfo=timezone.utc)
     from ..utils.auth import create_access_token
-    access_token = create_access_token(
-        data={"sub": user_id, "session_token": session_token}
-    )
+    claims = {"sub": user_id, "session_token": session_token, "session_exp": int(session_exp.timestamp())}
+    access_token = create_access_token(data=claims)
     
     return TokenResponse(
         access_token=access_token,
@@ -143,12 +148,14 @@ async def refresh_token(
 
 @router.delete("/logout", tags=["Authentication"])
 async def logout(
+    token: str = Depends(oauth2_scheme),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Logout user and revoke current session."""
     # In a real implementation, you'd extract session_token from JWT
     # and revoke that specific session
+    await forget_token(token)
     return {"message": "Successfully logged out"}
 
 
@@ -156,7 +163,7 @@ async def logout(
 @router.get("/me", response_model=UserAuthInfo, tags=["User Profile"])
 async def get_current_user_info(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current user information including sessions and OAuth accounts."""
     if not current_user.id:
@@ -165,50 +172,34 @@ async def get_current_user_info(
             detail="User ID is missing"
         )
     
-    # Get active sessions
-    sessions = get_active_sessions(db, current_user.id)
-    session_infos = []
-    for session in sessions:
-        if (session.id and session.created_at and session.expires_at and 
-            session.last_activity):
-            session_infos.append(SessionInfo(
-                id=session.id,
-                user_id=session.user_id,
-                status=session.status,
-                created_at=session.created_at,
-                expires_at=session.expires_at,
-                last_activity=session.last_activity,
-                ip_address=session.ip_address,
-                user_agent=session.user_agent
-            ))
-    
-    # Get OAuth accounts
-    statement = select(UserOAuthAccount).where(UserOAuthAccount.user_id == current_user.id)
-    oauth_accounts = db.exec(statement).all()
-    oauth_infos = []
-    for account in oauth_accounts:
-        if account.id and account.created_at:
-            oauth_infos.append(OAuthAccountInfo(
-                id=account.id,
-                provider=account.provider,
-                provider_email=account.provider_email,
-                created_at=account.created_at,
-                token_expires_at=account.token_expires_at
-            ))
+    # Load the user with its live sessions and OAuth accounts in one statement
+    now = _utcnow_naive()
+    statement = (
+        select(User)
+        .where(User.id == current_user.id)
+        .options(
+            joinedload(User.sessions.and_(
+                UserSession.status == SessionStatus.ACTIVE,
+                UserSession.expires_at > now
+            )),
+            joinedload(User.oauth_accounts)
+        )
+    )
+    user = (await db.exec(statement)).unique().one()
     
     return UserAuthInfo(
-        id=current_user.id,
-        username=current_user.username,
-        email=current_user.email,
-        sessions=session_infos,
-        oauth_accounts=oauth_infos
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        sessions=[SessionInfo.model_validate(session) for session in user.sessions],
+        oauth_accounts=[OAuthAccountInfo.model_validate(account) for account in user.oauth_accounts]
     )
 
 
 @router.get("/sessions", response_model=List[SessionInfo], tags=["Sessions"])
 async def get_user_sessions(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all active sessions for current user."""
     if not current_user.id:
@@ -217,45 +208,56 @@ async def get_user_sessions(
             detail="User ID is missing"
         )
     
-    sessions = get_active_sessions(db, current_user.id)
-    session_infos = []
-    for session in sessions:
-        if (session.id and session.created_at and session.expires_at and 
-            session.last_activity):
-            session_infos.append(SessionInfo(
-                id=session.id,
-                user_id=session.user_id,
-                status=session.status,
-                created_at=session.created_at,
-                expires_at=session.expires_at,
-                last_activity=session.last_activity,
-                ip_address=session.ip_address,
-                user_agent=session.user_agent
-            ))
-    return session_infos
+    # response_model validates the ORM rows straight into SessionInfo
+    return await get_active_sessions(db, current_user.id)
+
+
+async def _revoke_sessions(db: AsyncSession, *criteria) -> Sequence:
+    """Mark matching sessions revoked and return their (session_token, expires_at).
+
+    One UPDATE with RETURNING where the backend supports it; otherwise the
+    tokens are read first. The caller commits.
+    """
+    statement = (
+        update(UserSession)
+        .where(*criteria)
+        .values(status=SessionStatus.REVOKED)
+        .execution_options(synchronize_session=False)
+    )
+    
+    if db.bind.dialect.update_returning:
+        statement = statement.returning(UserSession.session_token, UserSession.expires_at)
+        return (await db.execute(statement)).all()
+    
+    revoked = (await db.execute(
+        select(UserSession.session_token, UserSession.expires_at).where(*criteria)
+    )).all()
+    await db.execute(statement)
+    return revoked
 
 
 @router.delete("/sessions/{session_id}", tags=["Sessions"])
 async def revoke_session(
     session_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Revoke a specific session."""
-    statement = select(UserSession).where(
+    revoked = await _revoke_sessions(
+        db,
         UserSession.id == session_id,
         UserSession.user_id == current_user.id
     )
-    session = db.exec(statement).first()
     
-    if not session:
+    if not revoked:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Session not found"
         )
     
-    session.status = SessionStatus.REVOKED
-    db.commit()
+    for session_token, expires_at in revoked:
+        await record_revocation(session_token, expires_at)
+    await db.commit()
     
     return {"message": "Session revoked successfully"}
 
@@ -263,7 +265,7 @@ async def revoke_session(
 @router.delete("/sessions", tags=["Sessions"])
 async def revoke_all_sessions(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Revoke all sessions for current user."""
     if not current_user.id:
@@ -272,14 +274,17 @@ async def revoke_all_sessions(
             detail="User ID is missing"
         )
     
-    sessions = get_active_sessions(db, current_user.id)
-    
-    for session in sessions:
-        session.status = SessionStatus.REVOKED
+    revoked = await _revoke_sessions(
+        db,
+        UserSession.user_id == current_user.id,
+        UserSession.status == SessionStatus.ACTIVE
+    )
     
-    db.commit()
+    for session_token, expires_at in revoked:
+        await record_revocation(session_token, expires_at)
+    await db.commit()
     
-    return {"message": f"Revoked {len(sessions)} sessions"}
+    return {"message": f"Revoked {len(revoked)} sessions"}
 
 
 # Impersonation endpoints
@@ -288,7 +293,7 @@ async def start_impersonation(
     request: ImpersonateRequest,
     req: Request,
     admin_user: User = Depends(get_admin_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Start impersonating another user (admin only)."""
     if not admin_user.id:
@@ -304,7 +309,7 @@ async def start_impersonation(
             detail="Cannot impersonate yourself"
         )
     
-    access_token, refresh_token, session_id = create_impersonation_session(
+    access_token, refresh_token, session_id = await create_impersonation_session(
         db=db,
         admin_user_id=admin_user.id,
         target_user_id=request.target_user_id,
@@ -326,7 +331,7 @@ async def start_impersonation(
 async def end_impersonation(
     request: EndImpersonationRequest,
     admin_user: User = Depends(get_admin_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """End an impersonation session (admin only)."""
     if not admin_user.id:
@@ -343,7 +348,7 @@ async def end_impersonation(
             detail="Impersonation session ID required"
         )
     
-    end_impersonation_session(db, session_id, admin_user.id)
+    await end_impersonation_session(db, session_id, admin_user.id)
     
     return {"message": "Impersonation session ended successfully"}
 
@@ -351,7 +356,7 @@ async def end_impersonation(
 @router.get("/impersonations", response_model=List[ImpersonationInfo], tags=["Admin"])
 async def list_impersonation_sessions(
     admin_user: User = Depends(get_admin_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List all impersonation sessions for current admin."""
     if not admin_user.id:
@@ -360,27 +365,28 @@ async def list_impersonation_sessions(
             detail="Admin user ID is missing"
         )
     
-    sessions = get_impersonation_sessions(db, admin_user.id)
+    sessions = await get_impersonation_sessions(db, admin_user.id)
+    
+    # Look up every admin and target username in one query
+    user_ids = {s.admin_user_id for s in sessions} | {s.target_user_id for s in sessions}
+    usernames = {}
+    if user_ids:
+        statement = select(User.id, User.username).where(User.id.in_(user_ids))
+        usernames = dict((await db.exec(statement)).all())
     
     result = []
     for session in sessions:
-        if not session.id:
-            continue
-            
-        # Get admin and target user info
-        admin_stmt = select(User).where(User.id == session.admin_user_id)
-        admin = db.exec(admin_stmt).first()
-        
-        target_stmt = select(User).where(User.id == session.target_user_id)
-        target = db.exec(target_stmt).first()
+        admin_username = usernames.get(session.admin_user_id)
+        target_username = usernames.get(session.target_user_id)
         
-        if admin and target and session.created_at:
+        # Skip sessions whose admin or target has since been deleted
+        if admin_username and target_username:
             result.append(ImpersonationInfo(
                 id=session.id,
                 admin_user_id=session.admin_user_id,
-                admin_username=admin.username,
+                admin_username=admin_username,
                 target_user_id=session.target_user_id,
-                target_username=target.username,
+                target_username=target_username,
                 reason=session.reason,
                 created_at=session.created_at,
                 expires_at=session.expires_at,
@@ -394,7 +400,7 @@ async def list_impersonation_sessions(
 @router.get("/whoami", response_model=dict, tags=["Authentication"])
 async def whoami(
     user_and_context: tuple[User, Optional[dict]] = Depends(get_current_user_with_impersonation),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current user info including impersonation status."""
     user, impersonation_context = user_and_context
@@ -410,7 +416,7 @@ async def whoami(
     if impersonation_context:
         # Get admin user info
         admin_stmt = select(User).where(User.id == impersonation_context["admin_user_id"])
-        admin_user = db.exec(admin_stmt).first()
+        admin_user = (await db.exec(admin_stmt)).first()
         
         result["impersonation"] = {
             "admin_user_id": impersonation_context["admin_user_id"],
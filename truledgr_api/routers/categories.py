@@ -1,22 +1,48 @@
 """Category router with CRUD operations."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import bindparam, exists
+from sqlmodel import delete, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional
 
-from ..database import get_db
-from ..models.category import Category, CategoryCreate, CategoryRead, CategoryUpdate
+from ..database import SessionFactory, get_async_db, get_async_session_factory
+from ..models.category import (
+    Category,
+    CategoryCreate,
+    CategoryRead,
+    CategoryPage,
+    CategoryUpdate,
+    CategoryTypeInfo,
+    CATEGORY_TYPE_INFOS_JSON,
+)
 from ..utils.auth import get_current_user
+from ..utils.coalesce import forget_user_reads
+from ..utils.crud import update_owned_record
+from ..utils.ownership import forget_owned_record
+from ..utils.responses import ndjson_response
+from ..models.transaction import Transaction
 from ..models.user import User
 
 router = APIRouter(tags=["Categories"])
 
+# Built once at import; per-request values are bound at execution time
+_SELECT_OWNED_CATEGORY = select(Category).where(
+    Category.id == bindparam("category_id"),
+    Category.user_id == bindparam("user_id")
+)
+_HAS_CATEGORY_TRANSACTIONS = select(exists().where(
+    Transaction.category_id == bindparam("category_id"),
+    Transaction.user_id == bindparam("user_id")
+))
+
 
 @router.post("/", response_model=CategoryRead, status_code=status.HTTP_201_CREATED)
 async def create_category(
     category: CategoryCreate, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new category for the current user."""
     # Create new category
@@ -30,35 +56,57 @@ async def create_category(
         parent_id=category.parent_id
     )
     
+    # Server defaults come back via RETURNING, so no refresh is needed
     db.add(db_category)
-    db.commit()
-    db.refresh(db_category)
+    await db.commit()
     
     return db_category
 
 
-@router.get("/", response_model=List[CategoryRead])
+@router.get("/", response_model=CategoryPage)
 async def read_categories(
-    skip: int = 0, 
-    limit: int = 100, 
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get the current user's categories, a page at a time in creation order."""
+    # Keyset pagination over (user_id, id); ULIDs sort by creation time
+    statement = select(Category).where(Category.user_id == current_user.id)
+    if cursor:
+        statement = statement.where(Category.id > cursor)
+    statement = statement.order_by(Category.id).limit(limit)
+    categories = (await db.exec(statement)).all()
+    
+    next_cursor = categories[-1].id if categories and len(categories) == limit else None
+    return CategoryPage(items=categories, next_cursor=next_cursor)
+
+
+@router.get("/types", response_model=List[CategoryTypeInfo])
+async def read_category_types():
+    """Get the catalog of supported category types."""
+    return Response(content=CATEGORY_TYPE_INFOS_JSON, media_type="application/json")
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_categories(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    session_factory: SessionFactory = Depends(get_async_session_factory)
 ):
-    """Get all categories for the current user."""
-    statement = select(Category).where(Category.user_id == current_user.id).offset(skip).limit(limit)
-    categories = db.exec(statement).all()
-    return categories
+    """Stream all of the current user's categories as newline-delimited JSON."""
+    statement = select(Category).where(Category.user_id == current_user.id).order_by(Category.id)
+    return ndjson_response(statement, CategoryRead, session_factory)
 
 
 @router.get("/{category_id}", response_model=CategoryRead)
 async def read_category(
     category_id: str, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific category by ID."""
-    statement = select(Category).where(Category.id == category_id, Category.user_id == current_user.id)
-    category = db.exec(statement).first()
+    params = {"category_id": category_id, "user_id": current_user.id}
+    category = (await db.exec(_SELECT_OWNED_CATEGORY, params=params)).first()
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -72,27 +120,20 @@ async def update_category(
     category_id: str,
     category_update: CategoryUpdate, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a category."""
-    statement = select(Category).where(
-        Category.id == category_id,
-        Category.user_id == current_user.id
+    db_category = await update_owned_record(
+        db, Category, category_id, current_user.id,  # type: ignore
+        category_update.model_dump(exclude_unset=True)
     )
-    db_category = db.exec(statement).first()
     if not db_category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Category not found"
         )
     
-    # Update only provided fields
-    category_data = category_update.model_dump(exclude_unset=True)
-    for field, value in category_data.items():
-        setattr(db_category, field, value)
-    
-    db.commit()
-    db.refresh(db_category)
+    await db.commit()
     
     return db_category
 
@@ -101,21 +142,38 @@ async def update_category(
 async def delete_category(
     category_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a category."""
-    statement = select(Category).where(
-        Category.id == category_id,
-        Category.user_id == current_user.id
+    # Transactions require their category, so refuse rather than orphan them
+    params = {"category_id": category_id, "user_id": current_user.id}
+    if (await db.exec(_HAS_CATEGORY_TRANSACTIONS, params=params)).one():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Category has transactions; delete or recategorize them first"
+        )
+    
+    # Promote subcategories to top level, as the ORM delete used to do
+    await db.execute(
+        update(Category)
+        .where(Category.parent_id == category_id, Category.user_id == current_user.id)
+        .values(parent_id=None)
     )
-    category = db.exec(statement).first()
-    if not category:
+    
+    result = await db.execute(
+        delete(Category).where(
+            Category.id == category_id,
+            Category.user_id == current_user.id
+        )
+    )
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Category not found"
         )
     
-    db.delete(category)
-    db.commit()
+    await db.commit()
+    forget_user_reads(current_user.id)  # type: ignore
+    forget_owned_record(Category, category_id, current_user.id)  # type: ignore
     
     return None
@@ -1,22 +1,44 @@
 """Institution router with CRUD operations."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import bindparam
+from sqlalchemy.orm import raiseload
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
-from ..database import get_db
-from ..models.institution import Institution, InstitutionCreate, InstitutionRead, InstitutionUpdate
+from ..database import SessionFactory, get_async_db, get_async_session_factory
+from ..models.institution import (
+    Institution,
+    InstitutionCreate,
+    InstitutionRead,
+    InstitutionUpdate,
+    InstitutionTypeInfo,
+    INSTITUTION_TYPE_INFOS_JSON,
+)
 from ..utils.auth import get_current_user
+from ..utils.coalesce import ReadCoalescer, forget_user_reads
+from ..utils.crud import update_owned_record
+from ..utils.responses import ndjson_response
 from ..models.user import User
 
 router = APIRouter(tags=["Institutions"])
 
+# Built once at import; per-request values are bound at execution time
+_SELECT_OWNED_INSTITUTION = select(Institution).options(raiseload("*")).where(
+    Institution.id == bindparam("institution_id"),
+    Institution.user_id == bindparam("user_id")
+)
+
+_list_reads = ReadCoalescer(InstitutionRead)
+
 
 @router.post("/", response_model=InstitutionRead, status_code=status.HTTP_201_CREATED)
 async def create_institution(
     institution: InstitutionCreate, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new institution for the current user."""
     # Create new institution
@@ -34,9 +56,10 @@ async def create_institution(
         description=institution.description
     )
     
+    # Server defaults come back via RETURNING, so no refresh is needed
     db.add(db_institution)
-    db.commit()
-    db.refresh(db_institution)
+    await db.commit()
+    forget_user_reads(current_user.id)  # type: ignore
     
     return db_institution
 
@@ -46,23 +69,39 @@ async def read_institutions(
     skip: int = 0, 
     limit: int = 100, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    session_factory: SessionFactory = Depends(get_async_session_factory)
 ):
     """Get all institutions for the current user."""
-    statement = select(Institution).where(Institution.user_id == current_user.id).offset(skip).limit(limit)
-    institutions = db.exec(statement).all()
-    return institutions
+    statement = select(Institution).options(raiseload("*")).where(Institution.user_id == current_user.id).offset(skip).limit(limit)
+    # Identical requests that arrive together share one query
+    return await _list_reads.all((current_user.id, skip, limit), statement, session_factory)
+
+
+@router.get("/types", response_model=List[InstitutionTypeInfo])
+async def read_institution_types():
+    """Get the catalog of supported institution types."""
+    return Response(content=INSTITUTION_TYPE_INFOS_JSON, media_type="application/json")
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_institutions(
+    current_user: User = Depends(get_current_user),
+    session_factory: SessionFactory = Depends(get_async_session_factory)
+):
+    """Stream all of the current user's institutions as newline-delimited JSON."""
+    statement = select(Institution).options(raiseload("*")).where(Institution.user_id == current_user.id).order_by(Institution.id)
+    return ndjson_response(statement, InstitutionRead, session_factory)
 
 
 @router.get("/{institution_id}", response_model=InstitutionRead)
 async def read_institution(
     institution_id: str, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific institution by ID."""
-    statement = select(Institution).where(Institution.id == institution_id, Institution.user_id == current_user.id)
-    institution = db.exec(statement).first()
+    params = {"institution_id": institution_id, "user_id": current_user.id}
+    institution = (await db.exec(_SELECT_OWNED_INSTITUTION, params=params)).first()
     if not institution:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -76,27 +115,21 @@ async def update_institution(
     institution_id: str,
     institution_update: InstitutionUpdate, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an institution."""
-    statement = select(Institution).where(
-        Institution.id == institution_id,
-        Institution.user_id == current_user.id
+    db_institution = await update_owned_record(
+        db, Institution, institution_id, current_user.id,  # type: ignore
+        institution_update.model_dump(exclude_unset=True)
     )
-    db_institution = db.exec(statement).first()
     if not db_institution:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Institution not found"
         )
     
-    # Update only provided fields
-    institution_data = institution_update.model_dump(exclude_unset=True)
-    for field, value in institution_data.items():
-        setattr(db_institution, field, value)
-    
-    db.commit()
-    db.refresh(db_institution)
+    await db.commit()
+    forget_user_reads(current_user.id)  # type: ignore
     
     return db_institution
 
@@ -105,21 +138,22 @@ async def update_institution(
 async def delete_institution(
     institution_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete an institution."""
     statement = select(Institution).where(
         Institution.id == institution_id,
         Institution.user_id == current_user.id
     )
-    institution = db.exec(statement).first()
+    institution = (await db.exec(statement)).first()
     if not institution:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Institution not found"
         )
     
-    db.delete(institution)
-    db.commit()
+    await db.delete(institution)
+    await db.commit()
+    forget_user_reads(current_user.id)  # type: ignore
     
     return None
@@ -1,22 +1,39 @@
 """Payee router with CRUD operations."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import bindparam
+from sqlalchemy.orm import raiseload
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
-from ..database import get_db
+from ..database import SessionFactory, get_async_db, get_async_session_factory
+from ..models.account import Account
 from ..models.payee import Payee, PayeeCreate, PayeeRead, PayeeUpdate
 from ..utils.auth import get_current_user
+from ..utils.coalesce import ReadCoalescer, forget_user_reads
+from ..utils.crud import update_record
+from ..utils.ownership import forget_owned_record, user_owns_record
+from ..utils.responses import ndjson_response
 from ..models.user import User
 
 router = APIRouter(tags=["Payees"])
 
+# Built once at import; per-request values are bound at execution time
+_SELECT_OWNED_PAYEE = select(Payee).options(raiseload("*")).where(
+    Payee.id == bindparam("payee_id"),
+    Payee.user_id == bindparam("user_id")
+)
+
+_list_reads = ReadCoalescer(PayeeRead)
+
 
 @router.post("/", response_model=PayeeRead, status_code=status.HTTP_201_CREATED)
 async def create_payee(
     payee: PayeeCreate, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new payee for the current user."""
     # Validate account payee logic
@@ -27,14 +44,7 @@ async def create_payee(
                 detail="account_id is required when is_account_payee is True"
             )
         # Verify the account belongs to the current user
-        from ..models.account import Account
-        account = db.exec(
-            select(Account).where(
-                Account.id == payee.account_id,
-                Account.user_id == current_user.id
-            )
-        ).first()
-        if not account:
+        if not await user_owns_record(db, Account, payee.account_id, current_user.id):  # type: ignore
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Account not found or does not belong to user"
@@ -58,9 +68,10 @@ async def create_payee(
         account_id=payee.account_id
     )
     
+    # Server defaults come back via RETURNING, so no refresh is needed
     db.add(db_payee)
-    db.commit()
-    db.refresh(db_payee)
+    await db.commit()
+    forget_user_reads(current_user.id)  # type: ignore
     
     return db_payee
 
@@ -70,26 +81,33 @@ async def read_payees(
     skip: int = 0, 
     limit: int = 100, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    session_factory: SessionFactory = Depends(get_async_session_factory)
 ):
     """Get all payees for the current user."""
-    statement = select(Payee).where(Payee.user_id == current_user.id).offset(skip).limit(limit)
-    payees = db.exec(statement).all()
-    return payees
+    statement = select(Payee).options(raiseload("*")).where(Payee.user_id == current_user.id).offset(skip).limit(limit)
+    # Identical requests that arrive together share one query
+    return await _list_reads.all((current_user.id, skip, limit), statement, session_factory)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_payees(
+    current_user: User = Depends(get_current_user),
+    session_factory: SessionFactory = Depends(get_async_session_factory)
+):
+    """Stream all of the current user's payees as newline-delimited JSON."""
+    statement = select(Payee).options(raiseload("*")).where(Payee.user_id == current_user.id).order_by(Payee.id)
+    return ndjson_response(statement, PayeeRead, session_factory)
 
 
 @router.get("/{payee_id}", response_model=PayeeRead)
 async def read_payee(
     payee_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific payee by ID."""
-    statement = select(Payee).where(
-        Payee.id == payee_id,
-        Payee.user_id == current_user.id
-    )
-    payee = db.exec(statement).first()
+    params = {"payee_id": payee_id, "user_id": current_user.id}
+    payee = (await db.exec(_SELECT_OWNED_PAYEE, params=params)).first()
     
     if not payee:
         raise HTTPException(
@@ -105,26 +123,29 @@ async def update_payee(
     payee_id: str,
     payee_update: PayeeUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a specific payee."""
-    statement = select(Payee).where(
-        Payee.id == payee_id,
-        Payee.user_id == current_user.id
-    )
-    db_payee = db.exec(statement).first()
-    
-    if not db_payee:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Payee not found"
-        )
+    owned = (Payee.id == payee_id, Payee.user_id == current_user.id)
     
     # Validate account payee logic
     update_data = payee_update.model_dump(exclude_unset=True)
     if 'is_account_payee' in update_data or 'account_id' in update_data:
-        is_account_payee = update_data.get('is_account_payee', db_payee.is_account_payee)
-        account_id = update_data.get('account_id', db_payee.account_id)
+        if 'is_account_payee' in update_data and 'account_id' in update_data:
+            is_account_payee = update_data['is_account_payee']
+            account_id = update_data['account_id']
+        else:
+            # Only half of the pair was sent, so read the stored other half
+            current = (await db.exec(
+                select(Payee.is_account_payee, Payee.account_id).where(*owned)
+            )).first()
+            if not current:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Payee not found"
+                )
+            is_account_payee = update_data.get('is_account_payee', current.is_account_payee)
+            account_id = update_data.get('account_id', current.account_id)
         
         if is_account_payee:
             if not account_id:
@@ -133,14 +154,7 @@ async def update_payee(
                     detail="account_id is required when is_account_payee is True"
                 )
             # Verify the account belongs to the current user
-            from ..models.account import Account
-            account = db.exec(
-                select(Account).where(
-                    Account.id == account_id,
-                    Account.user_id == current_user.id
-                )
-            ).first()
-            if not account:
+            if not await user_owns_record(db, Account, account_id, current_user.id):  # type: ignore
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Account not found or does not belong to user"
@@ -151,13 +165,15 @@ async def update_payee(
                 detail="account_id should only be provided when is_account_payee is True"
             )
     
-    # Update fields
-    for field, value in update_data.items():
-        setattr(db_payee, field, value)
+    db_payee = await update_record(db, Payee, update_data, *owned)
+    if not db_payee:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Payee not found"
+        )
     
-    db.add(db_payee)
-    db.commit()
-    db.refresh(db_payee)
+    await db.commit()
+    forget_user_reads(current_user.id)  # type: ignore
     
     return db_payee
 
@@ -166,14 +182,14 @@ async def update_payee(
 async def delete_payee(
     payee_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a specific payee."""
     statement = select(Payee).where(
         Payee.id == payee_id,
         Payee.user_id == current_user.id
     )
-    db_payee = db.exec(statement).first()
+    db_payee = (await db.exec(statement)).first()
     
     if not db_payee:
         raise HTTPException(
@@ -181,7 +197,9 @@ async def delete_payee(
             detail="Payee not found"
         )
     
-    db.delete(db_payee)
-    db.commit()
+    await db.delete(db_payee)
+    await db.commit()
+    forget_user_reads(current_user.id)  # type: ignore
+    forget_owned_record(Payee, payee_id, current_user.id)  # type: ignore
     
     return {"message": "Payee deleted successfully"}
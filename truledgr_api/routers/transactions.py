@@ -1,25 +1,71 @@
 """Transaction router with CRUD operations."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
-from typing import List
-from datetime import datetime, timezone
+from fastapi.responses import StreamingResponse
+from sqlalchemy import bindparam
+from sqlalchemy.orm import raiseload
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional
 
-from ..database import get_db
+from ..database import SessionFactory, get_async_db, get_async_session_factory
 from ..models.transaction import Transaction, TransactionCreate, TransactionRead, TransactionUpdate
+from ..models.account import Account
+from ..models.category import Category
+from ..models.payee import Payee
 from ..utils.auth import get_current_user
+from ..utils.coalesce import ReadCoalescer, forget_user_reads
+from ..utils.crud import update_owned_record
+from ..utils.ownership import user_owns_record
+from ..utils.responses import ndjson_response
 from ..models.user import User
 
 router = APIRouter(tags=["Transactions"])
 
+# Built once at import; per-request values are bound at execution time
+_SELECT_OWNED_TRANSACTION = select(Transaction).options(raiseload("*")).where(
+    Transaction.id == bindparam("transaction_id"),
+    Transaction.user_id == bindparam("user_id")
+)
+
+_list_reads = ReadCoalescer(TransactionRead)
+
+
+async def _verify_references(
+    db: AsyncSession,
+    user_id: str,
+    account_id: Optional[str] = None,
+    category_id: Optional[str] = None,
+    payee_id: Optional[str] = None
+):
+    """Ensure the account, category and payee a transaction points at belong to the user."""
+    for model, record_id, label in (
+        (Account, account_id, "Account"),
+        (Category, category_id, "Category"),
+        (Payee, payee_id, "Payee"),
+    ):
+        if record_id is not None and not await user_owns_record(db, model, record_id, user_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{label} not found or does not belong to user"
+            )
+
 
 @router.post("/", response_model=TransactionRead, status_code=status.HTTP_201_CREATED)
 async def create_transaction(
     transaction: TransactionCreate, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new transaction for the current user."""
+    await _verify_references(
+        db,
+        current_user.id,  # type: ignore
+        account_id=transaction.account_id,
+        category_id=transaction.category_id,
+        payee_id=transaction.payee_id
+    )
+    
     # Create new transaction
     db_transaction = Transaction(
         user_id=current_user.id,  # type: ignore
@@ -29,14 +75,15 @@ async def create_transaction(
         amount=transaction.amount,
         description=transaction.description,
         payee_id=transaction.payee_id,
-        transaction_date=transaction.transaction_date or datetime.now(timezone.utc),
+        transaction_date=transaction.transaction_date,
         reference_number=transaction.reference_number,
         notes=transaction.notes
     )
     
+    # Server defaults come back via RETURNING, so no refresh is needed
     db.add(db_transaction)
-    db.commit()
-    db.refresh(db_transaction)
+    await db.commit()
+    forget_user_reads(current_user.id)  # type: ignore
     
     return db_transaction
 
@@ -46,26 +93,33 @@ async def read_transactions(
     skip: int = 0, 
     limit: int = 100, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    session_factory: SessionFactory = Depends(get_async_session_factory)
 ):
     """Get all transactions for the current user."""
-    statement = select(Transaction).where(Transaction.user_id == current_user.id).offset(skip).limit(limit)
-    transactions = db.exec(statement).all()
-    return transactions
+    statement = select(Transaction).options(raiseload("*")).where(Transaction.user_id == current_user.id).offset(skip).limit(limit)
+    # Identical requests that arrive together share one query
+    return await _list_reads.all((current_user.id, skip, limit), statement, session_factory)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_transactions(
+    current_user: User = Depends(get_current_user),
+    session_factory: SessionFactory = Depends(get_async_session_factory)
+):
+    """Stream all of the current user's transactions as newline-delimited JSON."""
+    statement = select(Transaction).options(raiseload("*")).where(Transaction.user_id == current_user.id).order_by(Transaction.id)
+    return ndjson_response(statement, TransactionRead, session_factory)
 
 
 @router.get("/{transaction_id}", response_model=TransactionRead)
 async def read_transaction(
     transaction_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific transaction by ID."""
-    statement = select(Transaction).where(
-        Transaction.id == transaction_id,
-        Transaction.user_id == current_user.id
-    )
-    transaction = db.exec(statement).first()
+    params = {"transaction_id": transaction_id, "user_id": current_user.id}
+    transaction = (await db.exec(_SELECT_OWNED_TRANSACTION, params=params)).first()
     if not transaction:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -79,27 +133,29 @@ async def update_transaction(
     transaction_id: str,
     transaction_update: TransactionUpdate, 
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a transaction."""
-    statement = select(Transaction).where(
-        Transaction.id == transaction_id,
-        Transaction.user_id == current_user.id
+    transaction_data = transaction_update.model_dump(exclude_unset=True)
+    await _verify_references(
+        db,
+        current_user.id,  # type: ignore
+        category_id=transaction_data.get("category_id"),
+        payee_id=transaction_data.get("payee_id")
+    )
+    
+    db_transaction = await update_owned_record(
+        db, Transaction, transaction_id, current_user.id,  # type: ignore
+        transaction_data
     )
-    db_transaction = db.exec(statement).first()
     if not db_transaction:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transaction not found"
         )
     
-    # Update only provided fields
-    transaction_data = transaction_update.model_dump(exclude_unset=True)
-    for field, value in transaction_data.items():
-        setattr(db_transaction, field, value)
-    
-    db.commit()
-    db.refresh(db_transaction)
+    await db.commit()
+    forget_user_reads(current_user.id)  # type: ignore
     
     return db_transaction
 
@@ -108,21 +164,22 @@ async def update_transaction(
 async def delete_transaction(
     transaction_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a transaction."""
     statement = select(Transaction).where(
         Transaction.id == transaction_id,
         Transaction.user_id == current_user.id
     )
-    transaction = db.exec(statement).first()
+    transaction = (await db.exec(statement)).first()
     if not transaction:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transaction not found"
         )
     
-    db.delete(transaction)
-    db.commit()
+    await db.delete(transaction)
+    await db.commit()
+    forget_user_reads(current_user.id)  # type: ignore
     
     return None
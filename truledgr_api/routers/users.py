@@ -1,65 +1,58 @@
 """User router with CRUD operations."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from sqlalchemy import bindparam
+from sqlalchemy.orm import raiseload
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
-from ..database import get_db
+from ..database import get_async_db
 from ..models.user import User, UserCreate, UserRead, UserUpdate
+from ..utils.auth import get_password_hash_async
+from ..utils.auth_cache import forget_user
+from ..utils.crud import update_record
+from ..utils.users import ensure_user_is_new
 
 router = APIRouter(tags=["Users"])
 
+# Built once at import; per-request values are bound at execution time
+_SELECT_USER_BY_ID = select(User).options(raiseload("*")).where(User.id == bindparam("user_id"))
+
 
 @router.post("/", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-async def create_user(user: UserCreate, db: Session = Depends(get_db)):
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Create a new user."""
-    # Check if user already exists
-    statement = select(User).where(User.username == user.username)
-    existing_user = db.exec(statement).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already registered"
-        )
-    
-    # Check if email already exists
-    statement = select(User).where(User.email == user.email)
-    existing_email = db.exec(statement).first()
-    if existing_email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
+    await ensure_user_is_new(db, user)
     
-    # Create new user (in real app, hash the password)
+    # Create new user
     db_user = User(
         username=user.username,
         email=user.email,
         full_name=user.full_name,
-        hashed_password=user.password,  # In real app: hash_password(user.password)
+        hashed_password=await get_password_hash_async(user.password),
         is_active=True
     )
     
+    # Server defaults come back via RETURNING, so no refresh is needed
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
     
     return db_user
 
 
 @router.get("/", response_model=List[UserRead])
-async def read_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def read_users(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_db)):
     """Get all users."""
-    statement = select(User).offset(skip).limit(limit)
-    users = db.exec(statement).all()
+    statement = select(User).options(raiseload("*")).offset(skip).limit(limit)
+    users = (await db.exec(statement)).all()
     return users
 
 
 @router.get("/{user_id}", response_model=UserRead)
-async def read_user(user_id: str, db: Session = Depends(get_db)):
+async def read_user(user_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get a specific user by ID."""
-    statement = select(User).where(User.id == user_id)
-    user = db.exec(statement).first()
+    user = (await db.exec(_SELECT_USER_BY_ID, params={"user_id": user_id})).first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -69,43 +62,38 @@ async def read_user(user_id: str, db: Session = Depends(get_db)):
 
 
 @router.put("/{user_id}", response_model=UserRead)
-async def update_user(user_id: str, user_update: UserUpdate, db: Session = Depends(get_db)):
+async def update_user(user_id: str, user_update: UserUpdate, db: AsyncSession = Depends(get_async_db)):
     """Update a user."""
-    statement = select(User).where(User.id == user_id)
-    db_user = db.exec(statement).first()
+    user_data = user_update.model_dump(exclude_unset=True)
+    if "password" in user_data:
+        user_data["hashed_password"] = await get_password_hash_async(user_data.pop("password"))
+    
+    db_user = await update_record(db, User, user_data, User.id == user_id)
     if not db_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    # Update only provided fields
-    user_data = user_update.model_dump(exclude_unset=True)
-    if "password" in user_data:
-        # In real app: user_data["hashed_password"] = hash_password(user_data.pop("password"))
-        user_data["hashed_password"] = user_data.pop("password")
-    
-    for field, value in user_data.items():
-        setattr(db_user, field, value)
-    
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await forget_user(user_id)
     
     return db_user
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user(user_id: str, db: Session = Depends(get_db)):
+async def delete_user(user_id: str, db: AsyncSession = Depends(get_async_db)):
     """Delete a user."""
     statement = select(User).where(User.id == user_id)
-    user = db.exec(statement).first()
+    user = (await db.exec(statement)).first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    db.delete(user)
-    db.commit()
+    await db.delete(user)
+    await db.commit()
+    await forget_user(user_id)
     
     return None
@@ -1,57 +1,163 @@
 """Authentication utilities and dependencies."""
 
+import asyncio
+import os
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from typing import Optional, Sequence, Tuple
+from cachetools import TTLCache
+import bcrypt
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlmodel import Session, select
-from ulid import ULID
+from sqlalchemy import bindparam
+from sqlmodel import select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..config import settings
-from ..database import get_db
+from ..database import get_async_db
+from .auth_cache import (
+    RedisError,
+    cache_user,
+    get_cached_user,
+    is_session_revoked,
+    mark_session_revoked,
+    token_hash,
+)
 from ..models.user import User
-from ..models.auth import UserSession, SessionStatus, ImpersonationSession
+from ..models.auth import UserSession, SessionStatus, ImpersonationSession, SessionInfo
 
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Dedicated threads for bcrypt, which releases the GIL while hashing. A
+# process pool would only add pickling overhead on top of the same CPU work.
+_hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="password-hash")
+
+# Decoded payloads of recently verified tokens by token hash, see verify_token
+_decoded_tokens: "TTLCache[str, dict]" = TTLCache(maxsize=4096, ttl=30)
+# Hashes of recently rejected tokens, so replayed junk skips jwt.decode
+_rejected_tokens: "TTLCache[str, bool]" = TTLCache(maxsize=10_000, ttl=60)
+
+# How long a session stays valid after sign-in or its last refresh
+SESSION_LIFETIME = timedelta(hours=1)
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# Hot-path statements, built once; per-request values are bound at execution time
+_ACTIVE_SESSION_BY_TOKEN = (
+    # Bound names can't match column names in an UPDATE
+    UserSession.session_token == bindparam("token"),
+    UserSession.status == SessionStatus.ACTIVE,
+    UserSession.expires_at >= bindparam("now")
+)
+_TOUCH_ACTIVE_SESSION = (
+    update(UserSession)
+    .where(*_ACTIVE_SESSION_BY_TOKEN)
+    .values(last_activity=bindparam("now"), expires_at=bindparam("expires"))
+    .execution_options(synchronize_session=False)
+)
+_TOUCH_ACTIVE_SESSION_RETURNING = _TOUCH_ACTIVE_SESSION.returning(UserSession.user_id)
+_SELECT_ACTIVE_SESSION_USER_ID = select(UserSession.user_id).where(*_ACTIVE_SESSION_BY_TOKEN)
+_SELECT_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_SELECT_USER_WITH_IMPERSONATION = (
+    select(User, ImpersonationSession.reason)
+    .join(ImpersonationSession, ImpersonationSession.target_user_id == User.id)
+    .where(
+        User.id == bindparam("user_id"),
+        ImpersonationSession.session_token == bindparam("session_token"),
+        ImpersonationSession.status == SessionStatus.ACTIVE,
+        ImpersonationSession.expires_at >= bindparam("now")
+    )
+)
+_SELECT_USER_WITH_ACTIVE_SESSION = (
+    select(User)
+    .join(UserSession, UserSession.user_id == User.id)
+    .where(
+        User.id == bindparam("user_id"),
+        UserSession.session_token == bindparam("session_token"),
+        UserSession.status == SessionStatus.ACTIVE,
+        UserSession.expires_at >= bindparam("now")
+    )
+)
+_SELECT_SESSION_BY_TOKEN = select(UserSession).where(
+    UserSession.session_token == bindparam("session_token")
+)
+_SELECT_ACTIVE_SESSIONS_INFO = select(
+    UserSession.id,
+    UserSession.user_id,
+    UserSession.status,
+    UserSession.created_at,
+    UserSession.expires_at,
+    UserSession.last_activity,
+    UserSession.ip_address,
+    UserSession.user_agent
+).where(
+    UserSession.user_id == bindparam("user_id"),
+    UserSession.status == SessionStatus.ACTIVE,
+    UserSession.expires_at > bindparam("now")
+)
+_SELECT_ACTIVE_IMPERSONATION = select(ImpersonationSession).where(
+    ImpersonationSession.id == bindparam("session_id"),
+    ImpersonationSession.admin_user_id == bindparam("admin_user_id"),
+    ImpersonationSession.status == SessionStatus.ACTIVE
+)
+_SELECT_IMPERSONATIONS_BY_ADMIN = select(ImpersonationSession).where(
+    ImpersonationSession.admin_user_id == bindparam("admin_user_id")
+)
+
+
+def _utcnow_naive() -> datetime:
+    """Current UTC time without tzinfo, matching how session expiries are stored."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    except ValueError:  # not a bcrypt hash
+        return False
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password off the event loop so slow hashes don't stall other requests."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, verify_password, plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(settings.bcrypt_rounds)).decode()
+
 
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, get_password_hash, password)
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    """Create JWT access token."""
+
+def create_access_token(
+    data: dict, expires_delta: Optional[timedelta] = None, issued_at: Optional[datetime] = None
+):
+    """Create JWT access token, expiring ``expires_delta`` after ``issued_at`` (default now)."""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=15)
+    now = issued_at or datetime.now(timezone.utc)
+    expire = now + (expires_delta or timedelta(minutes=15))
     
     to_encode.update({"exp": expire, "type": "access"})
     encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
     return encoded_jwt
 
 
-def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None):
-    """Create JWT refresh token."""
+def create_refresh_token(
+    data: dict, expires_delta: Optional[timedelta] = None, issued_at: Optional[datetime] = None
+):
+    """Create JWT refresh token, expiring ``expires_delta`` after ``issued_at`` (default now)."""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(days=7)
+    now = issued_at or datetime.now(timezone.utc)
+    expire = now + (expires_delta or timedelta(days=7))
     
     to_encode.update({"exp": expire, "type": "refresh"})
     encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
@@ -59,15 +165,91 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None):
 
 
 def verify_token(token: str) -> Optional[dict]:
-    """Verify and decode JWT token."""
+    """Verify and decode JWT token.
+
+    Tokens are immutable, so a good signature stays good; repeat calls only
+    re-check the expiry instead of redoing the HMAC and JSON parse. Likewise a
+    rejected token stays rejected.
+    """
+    key = token_hash(token)
+    if key in _rejected_tokens:
+        return None
+    payload = _decoded_tokens.get(key)
+    if payload is not None:
+        if payload.get("exp", float("inf")) <= time.time():
+            _decoded_tokens.pop(key, None)
+            _rejected_tokens[key] = True
+            return None
+        return payload
+    
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
-        return payload
-    except JWTError:
+    except jwt.PyJWTError:
+        _rejected_tokens[key] = True
         return None
+    _decoded_tokens[key] = payload
+    return payload
+
+
+async def _session_active_from_token(session_token: str, session_exp: Optional[int]) -> Optional[bool]:
+    """Decide a session's state without the database, or return None if it can't.
+
+    Tokens carry their session's expiry as ``session_exp``, so when the Redis
+    revocation list can answer, the signed token is trusted without a query.
+    """
+    if session_exp is None:
+        return None
+    revoked = await is_session_revoked(session_token)
+    if revoked is None:
+        return None
+    return not revoked and session_exp > datetime.now(timezone.utc).timestamp()
+
+
+async def touch_session(db: AsyncSession, session_token: str) -> Optional[Tuple[str, datetime]]:
+    """Record activity on a session and extend it if it is still active.
+
+    Returns the session's user id and new (naive UTC) expiry, or None if the
+    session has expired or been revoked. One UPDATE with RETURNING where the
+    backend supports it; otherwise the session is read first. The caller commits.
+    """
+    now = _utcnow_naive()
+    params = {"token": session_token, "now": now, "expires": now + SESSION_LIFETIME}
+    if db.bind.dialect.update_returning:
+        user_id = (await db.execute(_TOUCH_ACTIVE_SESSION_RETURNING, params)).scalar_one_or_none()
+    else:
+        user_id = (await db.execute(_SELECT_ACTIVE_SESSION_USER_ID, params)).scalar_one_or_none()
+        if user_id is not None:
+            await db.execute(_TOUCH_ACTIVE_SESSION, params)
+    return None if user_id is None else (user_id, params["expires"])
+
+
+async def _load_session_user(db: AsyncSession, payload: dict) -> Optional[User]:
+    """Load the token's user if its session is still active, else return None.
+
+    The session is checked in the user query itself unless the token and the
+    Redis revocation list already settle it.
+    """
+    user_id: Optional[str] = payload.get("sub")
+    if user_id is None:
+        return None
+    
+    statement, params = _SELECT_USER_BY_ID, {"user_id": user_id}
+    session_token = payload.get("session_token")
+    if session_token:
+        active = await _session_active_from_token(session_token, payload.get("session_exp"))
+        if active is False:
+            return None
+        if active is None:
+            statement = _SELECT_USER_WITH_ACTIVE_SESSION
+            params.update(
+                session_token=session_token,
+                now=_utcnow_naive()
+            )
+    
+    return (await db.exec(statement, params=params)).first()
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> User:
     """Get current authenticated user from JWT token."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -75,90 +257,104 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    # Recently validated tokens skip JWT decoding and both lookups
+    cached_user = await get_cached_user(token)
+    if cached_user is not None:
+        return cached_user
+    
     payload = verify_token(token)
     if payload is None:
         raise credentials_exception
     
-    user_id: Optional[str] = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
-    
-    # Check if session is still active
-    session_token = payload.get("session_token")
-    if session_token:
-        statement = select(UserSession).where(
-            UserSession.session_token == session_token,
-            UserSession.status == SessionStatus.ACTIVE
-        )
-        session = db.exec(statement).first()
-        if not session or session.expires_at < datetime.now(timezone.utc).replace(tzinfo=None):
-            raise credentials_exception
-    
-    # Get user
-    statement = select(User).where(User.id == user_id)
-    user = db.exec(statement).first()
+    user = await _load_session_user(db, payload)
     if user is None:
         raise credentials_exception
     
+    await cache_user(token, payload.get("session_token") or "", payload["exp"], user)
     return user
 
 
-def create_user_session(db: Session, user_id: str, ip_address: Optional[str] = None, 
+async def create_user_session(db: AsyncSession, user_id: str, ip_address: Optional[str] = None, 
                        user_agent: Optional[str] = None) -> tuple[str, str]:
     """Create a new user session and return access and refresh tokens."""
     # Create session record
-    session_token = str(ULID())
-    refresh_token = str(ULID())
+    # Opaque bearer secrets: 128 random bits, no embedded timestamp
+    session_token = secrets.token_urlsafe(16)
+    refresh_token = secrets.token_urlsafe(16)
+    now = datetime.now(timezone.utc)
+    expires_at = now + SESSION_LIFETIME
     
     session = UserSession(
         user_id=user_id,
         session_token=session_token,
         refresh_token=refresh_token,
-        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),  # 1 hour
-        last_activity=datetime.now(timezone.utc),
+        expires_at=expires_at,
+        last_activity=now,
         ip_address=ip_address,
         user_agent=user_agent
     )
     
+    # The INSERT returns the server-side timestamps; nothing else needs reloading
     db.add(session)
-    db.commit()
-    db.refresh(session)
+    await db.commit()
     
-    # Create tokens
+    # Token expiries count from the same clock read as the session row
+    claims = {"sub": user_id, "session_token": session_token, "session_exp": int(expires_at.timestamp())}
     access_token = create_access_token(
-        data={"sub": user_id, "session_token": session_token},
-        expires_delta=timedelta(minutes=15)
+        data=claims,
+        expires_delta=timedelta(minutes=15),
+        issued_at=now
     )
     
     refresh_token_jwt = create_refresh_token(
-        data={"sub": user_id, "session_token": session_token},
-        expires_delta=timedelta(days=7)
+        data=claims,
+        expires_delta=timedelta(days=7),
+        issued_at=now
     )
     
     return access_token, refresh_token_jwt
 
 
-def revoke_user_session(db: Session, session_token: str):
+async def record_revocation(session_token: str, expires_at: datetime) -> None:
+    """Publish a session revocation to the shared cache, or fail with a 503.
+
+    Call before committing the revocation, so a failed write rolls it back
+    and the client can retry instead of the session staying valid via Redis.
+    """
+    try:
+        await mark_session_revoked(session_token, expires_at)
+    except (RedisError, OSError):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not revoke session, please retry"
+        )
+
+
+async def revoke_user_session(db: AsyncSession, session_token: str):
     """Revoke a user session."""
-    statement = select(UserSession).where(UserSession.session_token == session_token)
-    session = db.exec(statement).first()
+    params = {"session_token": session_token}
+    session = (await db.exec(_SELECT_SESSION_BY_TOKEN, params=params)).first()
     if session:
         session.status = SessionStatus.REVOKED
-        db.commit()
+        await db.flush()
+        await record_revocation(session_token, session.expires_at)
+        await db.commit()
 
 
-def get_active_sessions(db: Session, user_id: str) -> list[UserSession]:
+async def get_active_sessions(db: AsyncSession, user_id: str) -> list[SessionInfo]:
     """Get all active sessions for a user."""
-    statement = select(UserSession).where(
-        UserSession.user_id == user_id,
-        UserSession.status == SessionStatus.ACTIVE,
-        UserSession.expires_at > datetime.now(timezone.utc).replace(tzinfo=None)
-    )
-    return list(db.exec(statement).all())
+    # Plain columns skip the identity map and attribute instrumentation
+    params = {"user_id": user_id, "now": _utcnow_naive()}
+    rows = (await db.exec(_SELECT_ACTIVE_SESSIONS_INFO, params=params)).all()
+    return [SessionInfo(**row._mapping) for row in rows]
 
 
-def get_admin_dependency(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> User:
-    """Dependency to ensure current user is an admin."""
+def get_admin_dependency(current_user: User = Depends(get_current_user)) -> User:
+    """Dependency to ensure current user is an admin.
+
+    The admin flag comes from the user that get_current_user resolved, so it
+    shares that user's cache entry (dropped on user update) and never queries.
+    """
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -167,16 +363,16 @@ def get_admin_dependency(db: Session = Depends(get_db), current_user: User = Dep
     return current_user
 
 
-def create_impersonation_session(
-    db: Session, 
+async def create_impersonation_session(
+    db: AsyncSession, 
     admin_user_id: str, 
     target_user_id: str, 
     reason: Optional[str] = None
 ) -> tuple[str, str, str]:
     """Create an impersonation session and return tokens plus session ID."""
     # Verify target user exists and is active
-    statement = select(User).where(User.id == target_user_id)
-    target_user = db.exec(statement).first()
+    params = {"user_id": target_user_id}
+    target_user = (await db.exec(_SELECT_USER_BY_ID, params=params)).first()
     if not target_user or not target_user.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -184,7 +380,7 @@ def create_impersonation_session(
         )
     
     # Create impersonation session record
-    session_token = str(ULID())
+    session_token = secrets.token_urlsafe(16)
     
     impersonation_session = ImpersonationSession(
         admin_user_id=admin_user_id,
@@ -194,9 +390,9 @@ def create_impersonation_session(
         expires_at=datetime.now(timezone.utc) + timedelta(hours=2)  # 2 hour limit
     )
     
+    # Server defaults come back via RETURNING, so no refresh is needed
     db.add(impersonation_session)
-    db.commit()
-    db.refresh(impersonation_session)
+    await db.commit()
     
     # Create tokens with impersonation context
     access_token = create_access_token(
@@ -224,14 +420,10 @@ def create_impersonation_session(
     return access_token, refresh_token, str(impersonation_session.id)
 
 
-def end_impersonation_session(db: Session, session_id: str, admin_user_id: str):
+async def end_impersonation_session(db: AsyncSession, session_id: str, admin_user_id: str):
     """End an impersonation session."""
-    statement = select(ImpersonationSession).where(
-        ImpersonationSession.id == session_id,
-        ImpersonationSession.admin_user_id == admin_user_id,
-        ImpersonationSession.status == SessionStatus.ACTIVE
-    )
-    session = db.exec(statement).first()
+    params = {"session_id": session_id, "admin_user_id": admin_user_id}
+    session = (await db.exec(_SELECT_ACTIVE_IMPERSONATION, params=params)).first()
     
     if not session:
         raise HTTPException(
@@ -241,12 +433,14 @@ def end_impersonation_session(db: Session, session_id: str, admin_user_id: str):
     
     session.ended_at = datetime.now(timezone.utc)
     session.status = SessionStatus.REVOKED
-    db.commit()
+    await db.flush()
+    await record_revocation(session.session_token, session.expires_at)
+    await db.commit()
 
 
-def get_current_user_with_impersonation(
+async def get_current_user_with_impersonation(
     token: str = Depends(oauth2_scheme), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> tuple[User, Optional[dict]]:
     """Get current user and impersonation context if applicable."""
     credentials_exception = HTTPException(
@@ -259,60 +453,46 @@ def get_current_user_with_impersonation(
     if payload is None:
         raise credentials_exception
     
-    user_id: Optional[str] = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
-    
     # Check if this is an impersonation session
     impersonation_context = None
     if payload.get("impersonation"):
+        user_id: Optional[str] = payload.get("sub")
         session_token = payload.get("session_token")
         impersonation_session_id = payload.get("impersonation_session_id")
         admin_user_id = payload.get("admin_user_id")
+        if user_id is None or not (session_token and impersonation_session_id):
+            raise credentials_exception
         
-        if session_token and impersonation_session_id:
-            # Verify impersonation session is still active
-            statement = select(ImpersonationSession).where(
-                ImpersonationSession.session_token == session_token,
-                ImpersonationSession.status == SessionStatus.ACTIVE
+        # Verify impersonation session is still active while loading the target user
+        params = {
+            "user_id": user_id,
+            "session_token": session_token,
+            "now": _utcnow_naive()
+        }
+        row = (await db.exec(_SELECT_USER_WITH_IMPERSONATION, params=params)).first()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Impersonation session expired"
             )
-            imp_session = db.exec(statement).first()
-            if not imp_session or imp_session.expires_at < datetime.now(timezone.utc).replace(tzinfo=None):
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Impersonation session expired"
-                )
-            
-            impersonation_context = {
-                "admin_user_id": admin_user_id,
-                "impersonation_session_id": impersonation_session_id,
-                "session_token": session_token,
-                "reason": imp_session.reason
-            }
+        user, reason = row
+        
+        impersonation_context = {
+            "admin_user_id": admin_user_id,
+            "impersonation_session_id": impersonation_session_id,
+            "session_token": session_token,
+            "reason": reason
+        }
     else:
         # Regular session validation
-        session_token = payload.get("session_token")
-        if session_token:
-            statement = select(UserSession).where(
-                UserSession.session_token == session_token,
-                UserSession.status == SessionStatus.ACTIVE
-            )
-            session = db.exec(statement).first()
-            if not session or session.expires_at < datetime.now(timezone.utc).replace(tzinfo=None):
-                raise credentials_exception
-    
-    # Get user (target user in case of impersonation)
-    statement = select(User).where(User.id == user_id)
-    user = db.exec(statement).first()
-    if user is None:
-        raise credentials_exception
+        user = await _load_session_user(db, payload)
+        if user is None:
+            raise credentials_exception
     
     return user, impersonation_context
 
 
-def get_impersonation_sessions(db: Session, admin_user_id: str) -> list[ImpersonationSession]:
+async def get_impersonation_sessions(db: AsyncSession, admin_user_id: str) -> Sequence[ImpersonationSession]:
     """Get all impersonation sessions for an admin user."""
-    statement = select(ImpersonationSession).where(
-        ImpersonationSession.admin_user_id == admin_user_id
-    )
-    return list(db.exec(statement).all())
+    params = {"admin_user_id": admin_user_id}
+    return (await db.exec(_SELECT_IMPERSONATIONS_BY_ADMIN, params=params)).all()
@@ -0,0 +1,172 @@
+"""Short-lived cache of authenticated users and revoked sessions.
+
+User entries live in a per-process TTL cache and, when ``REDIS_URL`` is set and
+the ``redis`` package is installed, in Redis so every worker shares them.
+Revoked sessions are only tracked in Redis, see :func:`is_session_revoked`.
+"""
+
+import hashlib
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
+
+from ..config import settings
+from ..models.user import User
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+except ImportError:  # redis is optional
+    aioredis = None
+    RedisError = OSError
+
+
+USER_CACHE_TTL = 30  # seconds
+
+# token hash -> (session_token, token exp, user snapshot)
+_user_cache: "TTLCache[str, Tuple[str, int, Dict]]" = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL)
+
+_redis_client = None
+
+
+def get_redis():
+    """Return the shared Redis client, or None when Redis isn't configured."""
+    global _redis_client
+    if _redis_client is None and aioredis is not None and settings.redis_url:
+        _redis_client = aioredis.from_url(settings.redis_url)
+    return _redis_client
+
+
+def token_hash(token: str) -> str:
+    """Stable, non-reversible cache key for a bearer token."""
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+async def get_cached_user(token: str) -> Optional[User]:
+    """Return the cached user for ``token``, if any."""
+    key = token_hash(token)
+    entry = _user_cache.get(key)
+
+    if entry is None:
+        redis = get_redis()
+        if redis is None:
+            return None
+        try:
+            raw = await redis.get(f"auth:user:{key}")
+        except (RedisError, OSError):
+            return None
+        if raw is None:
+            return None
+        data = orjson.loads(raw)
+        entry = (data["session_token"], data["exp"], data["user"])
+        _user_cache[key] = entry
+
+    if entry[1] <= time.time():
+        return None
+
+    # Hand out a fresh detached instance so requests never share one object.
+    # The password hash is never cached, so it is left blank here.
+    return User.model_validate({**entry[2], "hashed_password": ""})
+
+
+async def cache_user(token: str, session_token: str, exp: int, user: User) -> None:
+    """Remember that ``token`` authenticates as ``user`` until at most ``exp``."""
+    key = token_hash(token)
+    snapshot = user.model_dump(mode="json", exclude={"hashed_password"})
+    _user_cache[key] = (session_token, exp, snapshot)
+
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.setex(
+                f"auth:user:{key}",
+                USER_CACHE_TTL,
+                orjson.dumps({"session_token": session_token, "exp": exp, "user": snapshot}),
+            )
+            # Indexes so a whole session or user can be invalidated at once
+            for index in (f"auth:session:{session_token}", f"auth:user-id:{user.id}"):
+                pipe.sadd(index, key)
+                pipe.expire(index, USER_CACHE_TTL)
+            await pipe.execute()
+    except (RedisError, OSError):
+        pass
+
+
+async def _forget(index: str, keys: set) -> None:
+    for key in keys:
+        _user_cache.pop(key, None)
+
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        keys = keys | {k.decode() for k in await redis.smembers(index)}
+        await redis.delete(index, *(f"auth:user:{key}" for key in keys))
+    except (RedisError, OSError):
+        pass
+
+
+async def forget_token(token: str) -> None:
+    """Drop the cache entry for a single access token."""
+    key = token_hash(token)
+    _user_cache.pop(key, None)
+
+    redis = get_redis()
+    if redis is not None:
+        try:
+            await redis.delete(f"auth:user:{key}")
+        except (RedisError, OSError):
+            pass
+
+
+async def forget_session(session_token: str) -> None:
+    """Drop every cached token issued for ``session_token``."""
+    keys = {key for key, (cached_session, _, _) in list(_user_cache.items()) if cached_session == session_token}
+    await _forget(f"auth:session:{session_token}", keys)
+
+
+async def forget_user(user_id: str) -> None:
+    """Drop every cached token for ``user_id``, e.g. after the user changes."""
+    keys = {key for key, (_, _, user) in list(_user_cache.items()) if user.get("id") == user_id}
+    await _forget(f"auth:user-id:{user_id}", keys)
+
+
+async def mark_session_revoked(session_token: str, expires_at: datetime) -> None:
+    """Record a revoked session until it would have expired anyway.
+
+    Raises ``RedisError`` or ``OSError`` if Redis is configured but the write
+    fails: readers trust tokens that aren't on the list, so a lost revocation
+    would leave the session usable. Call this before committing the
+    revocation so the caller can roll back and retry.
+    """
+    await forget_session(session_token)
+
+    redis = get_redis()
+    if redis is None:
+        return
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    remaining = int((expires_at - datetime.now(timezone.utc)).total_seconds())
+    if remaining <= 0:
+        return
+    await redis.set(f"auth:revoked:{session_token}", 1, ex=remaining)
+
+
+async def is_session_revoked(session_token: str) -> Optional[bool]:
+    """Check the Redis revocation list.
+
+    Returns None when Redis isn't configured or can't be reached, in which case
+    callers must check the session in the database instead.
+    """
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        return bool(await redis.exists(f"auth:revoked:{session_token}"))
+    except (RedisError, OSError):
+        return None
@@ -0,0 +1,68 @@
+"""Share one list query among concurrent identical requests."""
+
+import asyncio
+import weakref
+from functools import partial
+from typing import Dict, Hashable, List, Tuple, Type
+
+from sqlmodel import SQLModel
+from sqlmodel.sql.expression import SelectOfScalar
+
+from ..database import AsyncSessionLocal, SessionFactory
+
+
+_coalescers: "weakref.WeakSet[ReadCoalescer]" = weakref.WeakSet()
+
+
+class ReadCoalescer:
+    """Run at most one query per key at a time; concurrent callers share its rows.
+
+    Keys are tuples whose first item is the owning user's id, so a write can
+    drop that user's in-flight reads (see :func:`forget_user_reads`) and later
+    requests see it. Queries run in their own task and session, so a client
+    that disconnects doesn't cancel the query the other callers are awaiting.
+    Routes pass the session factory from ``get_async_session_factory`` so the
+    query honours overrides of it.
+    """
+
+    def __init__(self, schema: Type[SQLModel]):
+        self._schema = schema
+        self._flights: Dict[Tuple[Hashable, ...], "asyncio.Future[List[SQLModel]]"] = {}
+        _coalescers.add(self)
+
+    async def all(
+        self,
+        key: Tuple[Hashable, ...],
+        statement: SelectOfScalar,
+        session_factory: SessionFactory = AsyncSessionLocal,
+    ) -> List[SQLModel]:
+        """Return the rows of ``statement`` as read schemas, sharing any flight for ``key``."""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._fetch(statement, session_factory))
+            self._flights[key] = flight
+            flight.add_done_callback(partial(self._landed, key))
+        return await asyncio.shield(flight)
+
+    async def _fetch(self, statement: SelectOfScalar, session_factory: SessionFactory) -> List[SQLModel]:
+        async with session_factory() as db:
+            rows = (await db.exec(statement)).all()
+        # Read schemas are frozen, so every caller can safely share the same list
+        return [self._schema.model_validate(row) for row in rows]
+
+    def _landed(self, key: Tuple[Hashable, ...], flight: "asyncio.Future[List[SQLModel]]") -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.cancelled():
+            flight.exception()  # retrieved here so an unawaited failure isn't logged twice
+
+    def forget(self, user_id: str) -> None:
+        """Stop handing ``user_id``'s in-flight queries to new callers."""
+        for key in [key for key in self._flights if key[0] == user_id]:
+            del self._flights[key]
+
+
+def forget_user_reads(user_id: str) -> None:
+    """Call after committing a write so the user's next list reads start fresh."""
+    for coalescer in list(_coalescers):
+        coalescer.forget(user_id)
@@ -0,0 +1,47 @@
+"""Single-statement write helpers for user-owned records."""
+
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from sqlmodel import SQLModel, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+
+async def update_record(
+    db: AsyncSession,
+    model: Type[ModelT],
+    values: Dict[str, Any],
+    *criteria: Any,
+) -> Optional[ModelT]:
+    """Apply ``values`` to the ``model`` row matching ``criteria`` and return it.
+
+    Returns None when no such row exists. Uses UPDATE ... RETURNING where the
+    backend supports it, so the lookup, the write and the reload are one round
+    trip. The caller commits.
+    """
+    if not values:
+        return (await db.exec(select(model).where(*criteria))).first()
+
+    statement = update(model).where(*criteria).values(**values)
+    if db.bind.dialect.update_returning:
+        statement = statement.returning(model).execution_options(populate_existing=True)
+        return (await db.scalars(statement)).first()
+
+    result = await db.execute(statement)
+    if result.rowcount == 0:
+        return None
+    statement = select(model).where(*criteria).execution_options(populate_existing=True)
+    return (await db.exec(statement)).first()
+
+
+async def update_owned_record(
+    db: AsyncSession,
+    model: Type[ModelT],
+    record_id: str,
+    user_id: str,
+    values: Dict[str, Any],
+) -> Optional[ModelT]:
+    """Apply ``values`` to the ``model`` row owned by ``user_id`` and return it."""
+    return await update_record(db, model, values, model.id == record_id, model.user_id == user_id)
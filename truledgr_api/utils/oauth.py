@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class OAuthProviderSettings:
     """Settings for OAuth2 provider configuration."""
     client_id: str
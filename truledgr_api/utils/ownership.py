@@ -0,0 +1,30 @@
+"""Cached ownership checks for records referenced by other records."""
+
+from typing import Hashable, Tuple, Type
+
+from cachetools import TTLCache
+from sqlalchemy import exists
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+# (table name, user_id, record_id) -> True, only positive results are cached
+_owned_records: "TTLCache[Tuple[Hashable, ...], bool]" = TTLCache(maxsize=10_000, ttl=60)
+
+
+async def user_owns_record(db: AsyncSession, model: Type[SQLModel], record_id: str, user_id: str) -> bool:
+    """Return True if the ``model`` row ``record_id`` belongs to ``user_id``."""
+    key = (model.__tablename__, user_id, record_id)
+    if key in _owned_records:
+        return True
+
+    statement = select(exists().where(model.id == record_id, model.user_id == user_id))
+    owned = (await db.exec(statement)).one()
+    if owned:
+        _owned_records[key] = True
+    return owned
+
+
+def forget_owned_record(model: Type[SQLModel], record_id: str, user_id: str) -> None:
+    """Drop a cached ownership entry, e.g. after the record is deleted."""
+    _owned_records.pop((model.__tablename__, user_id, record_id), None)
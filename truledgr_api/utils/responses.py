@@ -0,0 +1,56 @@
+"""Response serialization settings shared by the main app and sub-apps."""
+
+import inspect
+from typing import Any, Dict, Type
+
+from fastapi.responses import StreamingResponse
+from fastapi.routing import serialize_response
+from sqlmodel import SQLModel
+from sqlmodel.sql.expression import SelectOfScalar
+
+from ..database import AsyncSessionLocal, SessionFactory
+
+
+def _has_native_json_serialization() -> bool:
+    """Return True when FastAPI renders response models to JSON bytes itself."""
+    return "dump_json" in inspect.signature(serialize_response).parameters
+
+
+def _json_response_options() -> Dict[str, Any]:
+    """Pick the fastest JSON response class for this FastAPI version.
+
+    Recent FastAPI releases serialize ``response_model`` data straight to bytes
+    with pydantic-core, but only while the default response class is left in
+    place. Older releases fall back to ``json.dumps``, so there we use orjson.
+    """
+    if _has_native_json_serialization():
+        return {}
+
+    from fastapi.responses import ORJSONResponse
+
+    return {"default_response_class": ORJSONResponse}
+
+
+# Keyword arguments to splat into ``FastAPI(...)``
+JSON_RESPONSE_OPTIONS: Dict[str, Any] = _json_response_options()
+
+
+def ndjson_response(
+    statement: SelectOfScalar,
+    schema: Type[SQLModel],
+    session_factory: SessionFactory = AsyncSessionLocal,
+) -> StreamingResponse:
+    """Stream the rows of ``statement`` as newline-delimited JSON.
+
+    Rows are fetched through a server-side cursor in batches, so memory stays
+    flat however many rows there are. The stream opens its own session because
+    request-scoped dependencies may be closed before the body is sent; routes
+    pass the factory from ``get_async_session_factory`` so overrides apply.
+    """
+    async def lines():
+        async with session_factory() as db:
+            rows = await db.stream_scalars(statement.execution_options(yield_per=500))
+            async for row in rows:
+                yield schema.model_validate(row).model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
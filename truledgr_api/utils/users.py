@@ -0,0 +1,26 @@
+"""Checks shared by the user router and the users sub-app."""
+
+from fastapi import HTTPException, status
+from sqlmodel import or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ..models.user import User, UserCreate
+
+
+async def ensure_user_is_new(db: AsyncSession, user: UserCreate) -> None:
+    """Raise 400 if the username or email is already registered."""
+    # One query covers both columns; a username clash is reported first
+    statement = select(User.username, User.email).where(
+        or_(User.username == user.username, User.email == user.email)
+    )
+    existing = (await db.exec(statement)).all()
+    if any(row.username == user.username for row in existing):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username already registered"
+        )
+    if existing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )